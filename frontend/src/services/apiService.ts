@@ -1,13 +1,16 @@
 import axios from "axios";
 import type { ItemsResponse, HistoryResponse, EventsResponse, Period } from "../types";
+import { PACKED_MIMETYPE, unpackStrings } from "../utils/stringPool";
 
 const API_BASE = "/price/api";
 
 export async function fetchItems(days: Period): Promise<ItemsResponse> {
-    const response = await axios.get<ItemsResponse>(`${API_BASE}/items`, {
+    // ストア名などの繰り返し文字列を文字列テーブルで圧縮した形式で受け取る
+    const response = await axios.get<{ strings: string[] } & Record<string, unknown>>(`${API_BASE}/items`, {
         params: { days },
+        headers: { Accept: PACKED_MIMETYPE },
     });
-    return response.data;
+    return unpackStrings<ItemsResponse>(response.data);
 }
 
 export async function fetchItemHistory(itemKey: string, days: Period): Promise<HistoryResponse> {
@@ -0,0 +1,35 @@
+/**
+ * 文字列プール形式のレスポンスのデコーダー
+ *
+ * サーバー側の実装は src/price_watch/webapi/string_pool.py を参照
+ */
+
+/** パック形式のレスポンスの MIME タイプ */
+export const PACKED_MIMETYPE = "application/vnd.pricewatch.packed+json";
+
+/** 文字列テーブルに置き換えられるキー（サーバー側の PACKED_KEYS と一致させること） */
+const PACKED_KEYS = new Set(["store", "best_store", "category", "price_unit"]);
+
+function unpackValue(value: unknown, strings: string[]): unknown {
+    if (Array.isArray(value)) {
+        return value.map((v) => unpackValue(v, strings));
+    }
+    if (value !== null && typeof value === "object") {
+        const result: Record<string, unknown> = {};
+        for (const [key, v] of Object.entries(value)) {
+            result[key] = PACKED_KEYS.has(key) && typeof v === "number" ? strings[v] : unpackValue(v, strings);
+        }
+        return result;
+    }
+    return value;
+}
+
+/**
+ * 文字列プール形式のレスポンスを元の形式に戻す
+ * @param packed strings テーブルを含むレスポンス
+ * @returns 文字列を復元したレスポンス
+ */
+export function unpackStrings<T>(packed: { strings: string[] } & Record<string, unknown>): T {
+    const { strings, ...rest } = packed;
+    return unpackValue(rest, strings) as T;
+}
@@ -61,7 +61,9 @@ class WebUIRunner:
         logging.info("Data path: %s (absolute: %s)", data_path, data_path.resolve())
         logging.info("DB file exists: %s", db_file.exists())
 
-        self.server_handle = price_watch.webapi.server.start(self.port, static_dir_path=static_dir_path)
+        self.server_handle = price_watch.webapi.server.start(
+            self.port, static_dir_path=static_dir_path, debug_mode=self.debug_mode
+        )
 
     def term(self) -> None:
         """サーバーを停止."""
@@ -304,6 +304,7 @@ class EditConfig:
 
     password_hash: str
     git: GitSyncConfig | None = None
+    backup_count: int = 10  # 保持する target.yaml のバックアップ数
 
     @classmethod
     def parse(cls, data: dict[str, Any]) -> EditConfig:
@@ -318,6 +319,7 @@ class EditConfig:
         return cls(
             password_hash=data["password_hash"],
             git=git,
+            backup_count=data.get("backup_count", 10),
         )
 
 
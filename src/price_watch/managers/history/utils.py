@@ -6,12 +6,19 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 
+# url_hash のキャッシュサイズ（監視対象アイテム数に対して十分な大きさ）
+_URL_HASH_CACHE_SIZE = 4096
 
+
+@functools.lru_cache(maxsize=_URL_HASH_CACHE_SIZE)
 def url_hash(url: str) -> str:
     """URL からハッシュを生成.
 
+    同じ URL に対してリクエストや巡回のたびに呼ばれるため、結果をキャッシュします。
+
     Args:
         url: URL 文字列
 
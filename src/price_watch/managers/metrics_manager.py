@@ -44,6 +44,7 @@ class MetricsManager:
         db_path = self.metrics_dir / "metrics.db"
         logging.info("Initializing metrics database at %s", db_path)
         self._db = price_watch.metrics.MetricsDB(db_path)
+        self._db.analyze()
 
     @property
     def db(self) -> price_watch.metrics.MetricsDB | None:
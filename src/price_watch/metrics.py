@@ -133,12 +133,27 @@ class MetricsDB:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         schema_sql = price_watch.const.SCHEMA_SQLITE_METRICS.read_text()
         with sqlite3.connect(self.db_path) as conn:
+            # WAL モード（DB ファイルに永続化される）: WebUI からの読み取りが巡回中の書き込みを待たない
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(schema_sql)
             conn.commit()
 
     def _get_conn(self) -> sqlite3.Connection:
         """データベース接続を取得"""
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        # WAL モードではコミットごとの fsync を省略しても DB の一貫性は保たれる
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def analyze(self) -> None:
+        """クエリプランナー用の統計情報を更新
+
+        統計情報がないと、実行中セッションの検索で部分カバリングインデックス
+        （idx_sessions_active）ではなく ended_at のインデックスが選ばれるため、
+        巡回開始時に一度だけ実行します。
+        """
+        with self._get_conn() as conn:
+            conn.execute("ANALYZE crawl_sessions")
 
     # === セッション管理 ===
 
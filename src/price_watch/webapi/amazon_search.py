@@ -7,10 +7,8 @@ Amazon PA-API を使用したキーワード検索機能を提供します。
 import logging
 
 import flask
-import my_lib.store.amazon.api
 from pydantic import BaseModel, Field
 
-import price_watch.store.amazon.paapi_rate_limiter
 import price_watch.webapi.cache
 
 blueprint = flask.Blueprint("amazon_search", __name__)
@@ -62,6 +60,11 @@ def check_available() -> flask.Response:
 @blueprint.route("/api/amazon/search", methods=["POST"])
 def search() -> flask.Response | tuple[flask.Response, int]:
     """Amazon 商品をキーワードで検索."""
+    # NOTE: PA-API クライアントは検索時にのみ必要なため、サーバー起動時には読み込まない
+    import my_lib.store.amazon.api
+
+    import price_watch.store.amazon.paapi_rate_limiter
+
     # リクエストのバリデーション
     try:
         data = flask.request.get_json()
@@ -8,19 +8,24 @@ target.yaml の変更を監視し、変更時にキャッシュを無効化し
 
 from __future__ import annotations
 
+import collections
+import datetime
 import logging
 import pathlib
 import threading
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
 
 import my_lib.file_watcher
-import my_lib.selenium_util
+import my_lib.time
 import my_lib.webapp.event
 
 import price_watch.config
 import price_watch.file_cache
 import price_watch.managers.history
 import price_watch.target
+import price_watch.webapi.compression
 from price_watch.managers import HistoryManager
 
 if TYPE_CHECKING:
@@ -60,6 +65,128 @@ def _on_target_file_changed() -> None:
     my_lib.webapp.event.notify_event(my_lib.webapp.event.EVENT_TYPE.CONTENT)
 
 
+@dataclass(frozen=True)
+class EncodedResponse:
+    """エンコード済みレスポンス（無圧縮・gzip・brotli の各バリアント）."""
+
+    raw: bytes
+    gzip: bytes
+    br: bytes
+
+    @classmethod
+    def create(cls, raw: bytes) -> EncodedResponse:
+        """無圧縮のバイト列から各圧縮バリアントを生成."""
+        return cls(
+            raw=raw,
+            gzip=price_watch.webapi.compression.compress(raw, "gzip"),
+            br=price_watch.webapi.compression.compress(raw, "br"),
+        )
+
+    def select(self, encoding: str | None) -> bytes:
+        """Content-Encoding に対応するバイト列を取得."""
+        if encoding == "br":
+            return self.br
+        if encoding == "gzip":
+            return self.gzip
+        return self.raw
+
+
+class _FileStamp(NamedTuple):
+    """ファイルの同一性と更新の検出に使う stat の値."""
+
+    dev: int
+    ino: int
+    size: int
+    mtime_ns: int
+
+
+# 価格履歴レスポンス（エンコード済み JSON）のキャッシュ
+# 履歴 DB（WAL 含む）のファイルの状態と target.yaml の設定オブジェクトが変わるまで有効
+# NOTE: 期間指定の履歴は現在時刻からの相対期間のため、日付が変わると別のキーになる
+_HISTORY_RESPONSE_CACHE_SIZE = 1024
+_history_response_cache: collections.OrderedDict[
+    tuple[str, int | None, datetime.date | None], EncodedResponse
+] = collections.OrderedDict()
+_history_response_db_stamp: tuple[_FileStamp | None, _FileStamp | None] | None = None
+_history_response_target_config: price_watch.target.TargetConfig | None = None
+_history_response_lock = threading.Lock()
+
+
+def _get_file_stamp(path: pathlib.Path) -> _FileStamp | None:
+    """ファイルの stat の値を取得（存在しない場合は None）."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return _FileStamp(stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _get_history_db_stamp() -> tuple[_FileStamp | None, _FileStamp | None]:
+    """履歴 DB 本体と WAL ファイルの状態を取得.
+
+    更新時刻に加えて inode とサイズも比較することで、DB の置き換えや
+    更新時刻の分解能内に収まる連続した書き込みも検出します。
+    """
+    db_path = get_history_manager().db.db_path
+    return (_get_file_stamp(db_path), _get_file_stamp(db_path.with_name(f"{db_path.name}-wal")))
+
+
+def clear_history_response_cache() -> None:
+    """価格履歴レスポンスのキャッシュをクリア."""
+    global _history_response_db_stamp, _history_response_target_config
+    with _history_response_lock:
+        _history_response_cache.clear()
+        _history_response_db_stamp = None
+        _history_response_target_config = None
+
+
+def get_history_response(
+    item_key: str,
+    days: int | None,
+    encoder: Callable[[], bytes | None],
+) -> EncodedResponse | None:
+    """エンコード済みの価格履歴レスポンスを取得（キャッシュ使用）.
+
+    Args:
+        item_key: アイテムキー
+        days: 期間（日数、None は全期間）
+        encoder: キャッシュミス時にレスポンスを生成する関数（アイテムが存在しない場合は None を返す）
+
+    Returns:
+        エンコード済みレスポンス、またはアイテムが存在しない場合は None
+    """
+    global _history_response_db_stamp, _history_response_target_config
+
+    db_stamp = _get_history_db_stamp()
+    target_config = get_target_config()
+    key = (item_key, days, None if days is None else my_lib.time.now().date())
+
+    with _history_response_lock:
+        if db_stamp != _history_response_db_stamp or target_config is not _history_response_target_config:
+            _history_response_cache.clear()
+            _history_response_db_stamp = db_stamp
+            _history_response_target_config = target_config
+
+        cached = _history_response_cache.get(key)
+        if cached is not None:
+            _history_response_cache.move_to_end(key)
+            return cached
+
+    raw = encoder()
+    if raw is None:
+        return None
+    body = EncodedResponse.create(raw)
+
+    with _history_response_lock:
+        # エンコード中に DB が更新された場合は古い内容をキャッシュしない
+        if db_stamp == _history_response_db_stamp:
+            _history_response_cache[key] = body
+            if len(_history_response_cache) > _HISTORY_RESPONSE_CACHE_SIZE:
+                _history_response_cache.popitem(last=False)
+
+    return body
+
+
 def get_history_manager() -> HistoryManager:
     """HistoryManager を取得（遅延初期化）."""
     global _history_manager
@@ -186,6 +313,9 @@ def get_yodobashi_driver() -> selenium.webdriver.remote.webdriver.WebDriver | No
     Returns:
         WebDriver インスタンス（初期化失敗時は None）
     """
+    # NOTE: Selenium 関連はヨドバシ検索の利用時にのみ必要なため、遅延インポートする
+    import my_lib.selenium_util
+
     global _yodobashi_driver
 
     with _yodobashi_driver_lock:
@@ -217,6 +347,8 @@ def quit_yodobashi_driver() -> None:
 
     with _yodobashi_driver_lock:
         if _yodobashi_driver is not None:
+            import my_lib.selenium_util
+
             logging.info("Quitting Yodobashi search WebDriver")
             my_lib.selenium_util.quit_driver_gracefully(_yodobashi_driver)
             _yodobashi_driver = None
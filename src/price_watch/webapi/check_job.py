@@ -16,9 +16,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
+import pydantic
 from flask import Blueprint, Response, current_app, jsonify, request
 
 import price_watch.webapi.cache
+import price_watch.webapi.schemas
 from price_watch.security.url_guard import validate_public_url
 
 if TYPE_CHECKING:
@@ -301,12 +303,18 @@ def start_check_item():
                 409,
             )
 
-    data = request.get_json()
-    if not data:
+    raw_body = request.get_data(cache=False)
+    if not raw_body:
         return jsonify({"error": "リクエストボディが必要です"}), 400
 
-    item_name = data.get("item_name")
-    store_name = data.get("store_name")
+    # dict を経由せず JSON バイト列を直接検証
+    try:
+        body = price_watch.webapi.schemas.CheckItemRequest.model_validate_json(raw_body)
+    except pydantic.ValidationError:
+        return jsonify({"error": "item_name と store_name が必要です"}), 400
+
+    item_name = body.item_name
+    store_name = body.store_name
 
     if not item_name or not store_name:
         return jsonify({"error": "item_name と store_name が必要です"}), 400
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""API レスポンスの圧縮.
+
+Accept-Encoding に応じて brotli または gzip でレスポンス本文を圧縮します。
+価格履歴などの JSON は冗長性が高く、圧縮によって転送量を大きく削減できます。
+"""
+
+from __future__ import annotations
+
+import gzip
+import zlib
+from collections.abc import Iterable, Iterator
+
+import brotli
+
+# 対応する Content-Encoding（優先順）
+ENCODINGS = ("br", "gzip")
+
+# 圧縮レベル（リクエストごとに実行するため速度寄り）
+_BROTLI_QUALITY = 4
+_GZIP_LEVEL = 6
+
+# gzip ヘッダー付きで deflate するための wbits
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """バイト列を指定の Content-Encoding で圧縮.
+
+    Args:
+        data: 圧縮するバイト列
+        encoding: "br" または "gzip"
+
+    Returns:
+        圧縮済みバイト列
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL)
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """ストリーミングレスポンスをチャンクごとに圧縮.
+
+    Args:
+        chunks: 元のチャンク列
+        encoding: "br" または "gzip"
+
+    Yields:
+        圧縮済みチャンク
+    """
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+        for chunk in chunks:
+            if out := compressor.process(chunk):
+                yield out
+        yield compressor.finish()
+    else:
+        deflater = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+        for chunk in chunks:
+            if out := deflater.compress(chunk):
+                yield out
+        yield deflater.flush()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""API エンドポイント向けの CORS ミドルウェア.
+
+許可オリジンは起動時に決まるため、付与するヘッダーを事前に組み立てておき、
+リクエストごとの処理はパスのプレフィックス判定と Origin の一致判定だけにします。
+プリフライト（OPTIONS）リクエストには Flask を経由せずに直接応答します。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# プリフライトで許可するメソッド
+_ALLOW_METHODS = "GET, HEAD, POST, PUT, PATCH, DELETE, OPTIONS"
+# プリフライト結果をブラウザにキャッシュさせる秒数
+_MAX_AGE = "86400"
+# 許可オリジンを限定している場合に常に付与するヘッダー（キャッシュをオリジンごとに分ける）
+_VARY_ORIGIN = ("Vary", "Origin")
+
+_StartResponse = Callable[..., Any]
+_WSGIApp = Callable[[dict[str, Any], _StartResponse], Iterable[bytes]]
+
+
+class CorsMiddleware:
+    """指定パス配下のレスポンスに CORS ヘッダーを付与する WSGI ミドルウェア."""
+
+    def __init__(self, app: _WSGIApp, path_prefix: str, origins: list[str] | str) -> None:
+        """CorsMiddleware を初期化.
+
+        Args:
+            app: ラップする WSGI アプリケーション
+            path_prefix: CORS を有効にするパスのプレフィックス
+            origins: 許可オリジンのリスト、または "*"（全許可）
+        """
+        self.app = app
+        self._path_prefix = path_prefix
+        self._allow_all = origins == "*"
+        # NOTE: スキームとホスト名は大文字小文字を区別しないため小文字で比較する
+        self._origins = frozenset() if self._allow_all else frozenset(o.lower() for o in origins)
+
+    def _origin_headers(self, origin: str | None) -> list[tuple[str, str]] | None:
+        if self._allow_all:
+            return [("Access-Control-Allow-Origin", "*")]
+        if origin is not None and origin.lower() in self._origins:
+            return [("Access-Control-Allow-Origin", origin), _VARY_ORIGIN]
+        return None
+
+    @staticmethod
+    def _append_headers(
+        start_response: _StartResponse, extra_headers: list[tuple[str, str]]
+    ) -> _StartResponse:
+        def _start_response(status: str, headers: list[tuple[str, str]], *args: Any) -> Any:
+            return start_response(status, headers + extra_headers, *args)
+
+        return _start_response
+
+    def __call__(self, environ: dict[str, Any], start_response: _StartResponse) -> Iterable[bytes]:
+        """リクエストを処理."""
+        if not environ.get("PATH_INFO", "").startswith(self._path_prefix):
+            return self.app(environ, start_response)
+
+        cors_headers = self._origin_headers(environ.get("HTTP_ORIGIN"))
+        if cors_headers is None:
+            # NOTE: 不一致や Origin なしのレスポンスも共有キャッシュで
+            #       許可オリジン向けのものと混ざらないよう Vary を付与する
+            return self.app(environ, self._append_headers(start_response, [_VARY_ORIGIN]))
+
+        if environ["REQUEST_METHOD"] == "OPTIONS" and "HTTP_ACCESS_CONTROL_REQUEST_METHOD" in environ:
+            preflight_headers = [
+                *cors_headers,
+                ("Access-Control-Allow-Methods", _ALLOW_METHODS),
+                ("Access-Control-Max-Age", _MAX_AGE),
+                ("Content-Length", "0"),
+            ]
+            request_headers = environ.get("HTTP_ACCESS_CONTROL_REQUEST_HEADERS")
+            if request_headers:
+                preflight_headers.append(("Access-Control-Allow-Headers", request_headers))
+            start_response("204 No Content", preflight_headers)
+            return []
+
+        return self.app(environ, self._append_headers(start_response, cors_headers))
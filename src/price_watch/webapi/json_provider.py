@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""orjson を使用した Flask JSON プロバイダー.
+
+標準の json モジュールの代わりに orjson でシリアライズすることで、
+価格履歴を含む大きな API レスポンスの生成を高速化します。
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import pathlib
+import uuid
+from typing import Any
+
+import flask
+import flask.json.provider
+import orjson
+import pydantic
+import werkzeug.http
+
+# 文字列以外のキー（int 等）を許可し、日時は _default で Flask 互換の形式に変換する
+_DUMPS_OPTION = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """orjson が直接扱えない型を変換.
+
+    Flask 標準の DefaultJSONProvider と同じ表現を返します。
+    """
+    if isinstance(obj, datetime.date):
+        return werkzeug.http.http_date(obj)
+    if isinstance(obj, decimal.Decimal | uuid.UUID | pathlib.PurePath):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_option(kwargs: dict[str, Any]) -> int:
+    """json.dumps 互換のキーワード引数を orjson のオプションに変換."""
+    option = _DUMPS_OPTION
+    if kwargs.get("sort_keys"):
+        option |= orjson.OPT_SORT_KEYS
+    if kwargs.get("indent"):
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+    """オブジェクトを JSON バイト列にシリアライズ."""
+    return orjson.dumps(obj, default=_default, option=_dumps_option(kwargs))
+
+
+def schema_response(schema: pydantic.BaseModel) -> flask.Response:
+    """レスポンススキーマを JSON レスポンスに変換.
+
+    dict を経由せず pydantic-core で直接 JSON にシリアライズします。
+    """
+    return flask.Response(schema.model_dump_json(), mimetype="application/json")
+
+
+class ORJSONProvider(flask.json.provider.JSONProvider):
+    """orjson ベースの JSON プロバイダー."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """オブジェクトを JSON 文字列にシリアライズ."""
+        return dumps_bytes(obj, **kwargs).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """JSON 文字列をデシリアライズ."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> flask.Response:
+        """JSON レスポンスを生成（bytes のまま Response に渡す）."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj) + b"\n", mimetype=self.mimetype)
@@ -8,6 +8,10 @@ from datetime import datetime as dt
 
 import price_watch.metrics
 
+_DAY_NAMES = ("月", "火", "水", "木", "金", "土", "日")
+# weekday() をインデックスとした日付ラベルの CSS クラス（土曜: 青、日曜: 赤）
+_WEEKDAY_CLASS = ("label", "label", "label", "label", "label", "label-sat", "label-sun")
+
 
 def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
     """GitHubスタイルのヒートマップSVGを直接生成.
@@ -22,7 +26,6 @@ def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
     """
     dates = heatmap.dates
     hours = heatmap.hours
-    day_names = ["月", "火", "水", "木", "金", "土", "日"]
 
     # カラーパレット（5段階：灰色→黄色→緑）
     colors = ["#e0e0e0", "#fff59d", "#ffee58", "#a5d610", "#4caf50"]
@@ -67,6 +70,13 @@ def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
     # セルデータをマップ化
     cell_map = {(c.date, c.hour): c.uptime_rate for c in heatmap.cells}
 
+    # 日付ごとの表示ラベルと曜日を事前計算（ラベル・ツールチップの両方で使用）
+    date_info: list[tuple[str, int]] = []
+    for date_str in dates:
+        date_obj = dt.strptime(date_str, "%Y-%m-%d")
+        weekday = date_obj.weekday()
+        date_info.append((f"{date_obj.month}月{date_obj.day}日({_DAY_NAMES[weekday]})", weekday))
+
     # セル幅を計算（横幅固定）
     available_width = target_width - margin_left - margin_right
     cell_step_x = available_width / num_dates
@@ -100,20 +110,20 @@ def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
     # 許容される最小x座標（左端から少し余裕を持たせつつ、時刻ラベルエリアも活用）
     min_label_x = 4.0
 
+    first_idx = label_indices[0]
+    last_idx = label_indices[-1]
+
     for j in label_indices:
-        date_str = dates[j]
-        date_obj = dt.strptime(date_str, "%Y-%m-%d")
-        dow = day_names[date_obj.weekday()]
-        label = f"{date_obj.month}月{date_obj.day}日({dow})"
+        label, weekday = date_info[j]
 
         # 位置とアンカーを決定
         cell_center_x = margin_left + j * cell_step_x + cell_width / 2
 
-        if j == label_indices[0] and cell_center_x - label_half_width < min_label_x:
+        if j == first_idx and cell_center_x - label_half_width < min_label_x:
             # 最初のラベル: 見切れる場合のみ左寄せ（時刻ラベルエリアも活用）
             x = min_label_x
             anchor = "start"
-        elif j == label_indices[-1] and cell_center_x + label_half_width > svg_width:
+        elif j == last_idx and cell_center_x + label_half_width > svg_width:
             # 最後のラベル: 見切れる場合のみ右寄せ
             x = margin_left + j * cell_step_x + cell_width
             anchor = "end"
@@ -122,13 +132,7 @@ def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
             x = cell_center_x
             anchor = "middle"
 
-        weekday = date_obj.weekday()
-        if weekday == 5:  # 土曜日
-            css_class = "label-sat"
-        elif weekday == 6:  # 日曜日
-            css_class = "label-sun"
-        else:
-            css_class = "label"
+        css_class = _WEEKDAY_CLASS[weekday]
         svg_parts.append(
             f'<text x="{x}" y="{margin_top - 5}" class="{css_class}" text-anchor="{anchor}">{label}</text>'
         )
@@ -155,10 +159,8 @@ def generate_heatmap_svg(heatmap: price_watch.metrics.HeatmapData) -> bytes:
             ratio = cell_map.get((date_str, hour))
             color = get_color(ratio)
             # ツールチップ用のテキスト
-            date_obj = dt.strptime(date_str, "%Y-%m-%d")
-            dow = day_names[date_obj.weekday()]
             ratio_text = f"{ratio * 100:.1f}%" if ratio is not None else "データなし"
-            tooltip = f"{date_obj.month}月{date_obj.day}日({dow}) {hour}時台: {ratio_text}"
+            tooltip = f"{date_info[j][0]} {hour}時台: {ratio_text}"
             svg_parts.append(
                 f'<rect x="{x}" y="{y}" width="{cell_width}" height="{cell_height}" '
                 f'fill="{color}" data-tooltip="{tooltip}" class="heatmap-cell" '
@@ -3,11 +3,17 @@
 
 import json
 import logging
+import os
 import pathlib
+import platform
 from dataclasses import dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import flask
+import msgspec
+import my_lib.time
+import pydantic
 from flask_pydantic import validate
 
 import price_watch.event
@@ -17,9 +23,12 @@ import price_watch.models
 import price_watch.target
 import price_watch.thumbnail
 import price_watch.webapi.cache
+import price_watch.webapi.compression
+import price_watch.webapi.json_provider
 import price_watch.webapi.metrics
 import price_watch.webapi.ogp
 import price_watch.webapi.schemas
+import price_watch.webapi.string_pool
 
 if TYPE_CHECKING:
     from price_watch.target import ResolvedItem
@@ -230,9 +239,10 @@ def _build_history_entries(
     """履歴エントリリストを構築.
 
     price が None の場合（在庫なし）も含めて返す。
+    DB 由来の信頼できるデータのため、バリデーションを省略して構築する。
     """
     return [
-        price_watch.webapi.schemas.PriceHistoryPoint(
+        price_watch.webapi.schemas.PriceHistoryPoint.model_construct(
             time=h.time,
             price=h.price,
             effective_price=_calc_effective_price(h.price, point_rate),
@@ -266,7 +276,8 @@ def _build_store_entry(
     current_price = latest.price  # None の場合がある
     effective_price = _calc_effective_price(current_price, point_rate)
 
-    return price_watch.webapi.schemas.StoreEntry(
+    # DB 由来の信頼できるデータのため、バリデーションを省略して構築
+    return price_watch.webapi.schemas.StoreEntry.model_construct(
         item_key=item.item_key,
         store=item.store,
         url=item.url,
@@ -322,7 +333,7 @@ def _build_result_item(
     best_store_entry = _find_best_store(stores)
     thumb_url = _find_first_thumb_url(store_data_list)
 
-    return price_watch.webapi.schemas.ResultItem(
+    return price_watch.webapi.schemas.ResultItem.model_construct(
         name=name,
         thumb_url=thumb_url,
         stores=stores,
@@ -430,7 +441,7 @@ def _build_store_entry_without_history_from_record(
     price_unit: str,
 ) -> price_watch.webapi.schemas.StoreEntry:
     """履歴がないアイテム用のストアエントリを構築（ItemRecord版）."""
-    return price_watch.webapi.schemas.StoreEntry(
+    return price_watch.webapi.schemas.StoreEntry.model_construct(
         item_key=item.item_key,
         store=item.store,
         url=item.url,
@@ -650,19 +661,71 @@ def _process_item_without_db(
     return ProcessedStoreData(store_entry=store_entry, thumb_url=item.thumb_url)
 
 
+# レスポンスの MIME タイプ（msgpack は内部クライアント向け）
+_JSON_MIMETYPE = "application/json"
+_MSGPACK_MIMETYPE = "application/msgpack"
+
+
+def _accepts_msgpack() -> bool:
+    """リクエストが JSON より msgpack を優先しているか判定."""
+    best = flask.request.accept_mimetypes.best_match([_JSON_MIMETYPE, _MSGPACK_MIMETYPE])
+    return best == _MSGPACK_MIMETYPE
+
+
+def _accepts_packed() -> bool:
+    """リクエストが文字列プール形式の JSON を要求しているか判定."""
+    best = flask.request.accept_mimetypes.best_match(
+        [_JSON_MIMETYPE, price_watch.webapi.string_pool.PACKED_MIMETYPE]
+    )
+    return best == price_watch.webapi.string_pool.PACKED_MIMETYPE
+
+
+def _build_history_msgpack_response(
+    history: list[price_watch.models.PriceRecord], point_rate: float
+) -> flask.Response:
+    """価格履歴を msgpack 形式のレスポンスとして構築."""
+    payload = price_watch.webapi.schemas.HistoryResponseStruct(
+        history=[
+            price_watch.webapi.schemas.PriceHistoryPointStruct(
+                time=h.time,
+                price=h.price,
+                effective_price=_calc_effective_price(h.price, point_rate),
+                stock=h.stock,
+            )
+            for h in history
+        ]
+    )
+    response = flask.Response(msgspec.msgpack.encode(payload), mimetype=_MSGPACK_MIMETYPE)
+    response.vary.add("Accept")
+    return response
+
+
+def _get_period_param() -> price_watch.webapi.schemas.Period:
+    """クエリパラメータ days を Period として検証.
+
+    不正な値の場合は flask-pydantic と同じ形式の 400 レスポンスで中断します。
+    """
+    try:
+        return price_watch.webapi.schemas.PERIOD_VALIDATOR.validate_python(
+            flask.request.args.get("days", "30")
+        )
+    except pydantic.ValidationError as e:
+        errors = [
+            {**err, "loc": ["days", *err["loc"]]}
+            for err in e.errors(include_url=False, include_context=False)
+        ]
+        flask.abort(flask.make_response(flask.jsonify({"validation_error": {"query_params": errors}}), 400))
+
+
 @blueprint.route("/api/items")
-@validate()
-def get_items(
-    query: price_watch.webapi.schemas.ItemsQueryParams,
-) -> flask.Response | tuple[flask.Response, int]:
+def get_items() -> flask.Response | tuple[flask.Response, int]:
     """アイテム一覧を取得（複数ストア対応・実質価格付き）.
 
     履歴データはペイロード削減のため含まれません。
     履歴が必要な場合は /api/items/<item_key>/history を使用してください。
     """
+    days = _parse_days(_get_period_param())
     try:
-        days = _parse_days(query.days)
-
         # target.yaml の設定を取得（キャッシュ使用）
         target_config = price_watch.webapi.cache.get_target_config()
         target_item_keys = _get_target_item_keys(target_config)
@@ -701,14 +764,27 @@ def get_items(
         app_config = price_watch.webapi.cache.get_app_config()
         check_interval_sec = app_config.check.interval_sec if app_config else 1800
 
-        response = price_watch.webapi.schemas.ItemsResponse(
+        response = price_watch.webapi.schemas.ItemsResponse.model_construct(
             items=result_items,
             store_definitions=_get_store_definitions(target_config),
             categories=categories,
             check_interval_sec=check_interval_sec,
         )
 
-        return flask.jsonify(response.model_dump())
+        # 文字列プール形式が要求された場合は繰り返し文字列をテーブル化して返す
+        if _accepts_packed():
+            packed = price_watch.webapi.string_pool.pack(response.model_dump(mode="json"))
+            packed_response = flask.Response(
+                price_watch.webapi.json_provider.dumps_bytes(packed),
+                mimetype=price_watch.webapi.string_pool.PACKED_MIMETYPE,
+            )
+            packed_response.vary.add("Accept")
+            return packed_response
+
+        # NOTE: 本文はメモリ上に構築済みのため、ストリーミングせずに返して ETag による 304 応答を有効にする
+        json_response = price_watch.webapi.json_provider.schema_response(response)
+        json_response.vary.add("Accept")
+        return json_response
 
     except Exception as e:
         logging.exception("Error getting items")
@@ -736,30 +812,62 @@ def serve_thumb(filename: str) -> flask.Response:
     )
 
 
-@blueprint.route("/api/items/<item_key>/history")
-@validate()
-def get_item_history(
-    item_key: str, query: price_watch.webapi.schemas.HistoryQueryParams
-) -> flask.Response | tuple[flask.Response, int]:
-    """アイテム別価格履歴を取得."""
-    try:
-        days = _parse_days(query.days)
+def _encoded_json_response(body: price_watch.webapi.cache.EncodedResponse) -> flask.Response:
+    """事前圧縮済みのバリアントから Accept-Encoding に合うものを選んでレスポンスを生成."""
+    encoding = flask.request.accept_encodings.best_match(price_watch.webapi.compression.ENCODINGS)
+    response = flask.Response(body.select(encoding), mimetype=_JSON_MIMETYPE)
+    if encoding is not None:
+        response.content_encoding = encoding
+    response.vary.update(("Accept", "Accept-Encoding"))
+    return response
 
-        item, hist = price_watch.webapi.cache.get_history_manager().get_history(item_key, days)
 
-        if item is None:
-            error = price_watch.webapi.schemas.ErrorResponse(error="Item not found")
-            return flask.jsonify(error.model_dump()), 404
+def _item_not_found_response() -> tuple[flask.Response, int]:
+    """アイテムが存在しない場合の 404 レスポンスを生成."""
+    error = price_watch.webapi.schemas.ErrorResponse(error="Item not found")
+    return flask.jsonify(error.model_dump()), 404
+
+
+def _encode_history_json(item_key: str, days: int | None) -> bytes | None:
+    """価格履歴レスポンスを JSON バイト列にエンコード.
+
+    Returns:
+        JSON バイト列、またはアイテムが存在しない場合は None
+    """
+    item, hist = price_watch.webapi.cache.get_history_manager().get_history(item_key, days)
+    if item is None:
+        return None
+
+    # ポイント還元率を取得（キャッシュ使用）
+    target_config = price_watch.webapi.cache.get_target_config()
+    point_rate = _get_point_rate(target_config, item.store)
+
+    # 履歴を構築（effective_price 付き）
+    formatted_history = _build_history_entries(hist, point_rate)
+    response = price_watch.webapi.schemas.HistoryResponse.model_construct(history=formatted_history)
+    return response.model_dump_json().encode()
 
-        # ポイント還元率を取得（キャッシュ使用）
-        target_config = price_watch.webapi.cache.get_target_config()
-        point_rate = _get_point_rate(target_config, item.store)
 
-        # 履歴を構築（effective_price 付き）
-        formatted_history = _build_history_entries(hist, point_rate)
+@blueprint.route("/api/items/<item_key>/history")
+def get_item_history(item_key: str) -> flask.Response | tuple[flask.Response, int]:
+    """アイテム別価格履歴を取得."""
+    days = _parse_days(_get_period_param())
+    try:
+        # 内部クライアント向け: msgpack が要求された場合はバイナリで返す
+        if _accepts_msgpack():
+            item, hist = price_watch.webapi.cache.get_history_manager().get_history(item_key, days)
+            if item is None:
+                return _item_not_found_response()
+            point_rate = _get_point_rate(price_watch.webapi.cache.get_target_config(), item.store)
+            return _build_history_msgpack_response(hist, point_rate)
+
+        body = price_watch.webapi.cache.get_history_response(
+            item_key, days, lambda: _encode_history_json(item_key, days)
+        )
+        if body is None:
+            return _item_not_found_response()
 
-        response = price_watch.webapi.schemas.HistoryResponse(history=formatted_history)
-        return flask.jsonify(response.model_dump())
+        return _encoded_json_response(body)
 
     except Exception:
         logging.exception("Error getting item history")
@@ -1419,10 +1527,6 @@ def api_metrics_heatmap(
         return flask.make_response(flask.jsonify({"error": "Metrics DB not available"}), 503)
 
     # デフォルト: 過去7日間
-    from datetime import timedelta
-
-    import my_lib.time
-
     now = my_lib.time.now()
     end_date = query.end_date if query.end_date else now.strftime("%Y-%m-%d")
     start_date = query.start_date if query.start_date else (now - timedelta(days=6)).strftime("%Y-%m-%d")
@@ -1447,10 +1551,6 @@ def api_metrics_heatmap_svg(
     if metrics_db is None:
         return flask.Response("Metrics DB not available", status=503)
 
-    from datetime import timedelta
-
-    import my_lib.time
-
     now = my_lib.time.now()
     end_date = now.strftime("%Y-%m-%d")
     start_date = (now - timedelta(days=query.days - 1)).strftime("%Y-%m-%d")
@@ -1539,14 +1639,21 @@ def api_metrics_failures_timeseries(
         return flask.make_response(flask.jsonify({"error": "Internal server error"}), 500)
 
 
+# タイムゾーン名（実行中に変わらないため初回取得時にキャッシュ）
+_timezone_name: str | None = None
+
+
+def _get_timezone_name() -> str:
+    """タイムゾーン名を取得（キャッシュ付き）."""
+    global _timezone_name
+    if _timezone_name is None:
+        _timezone_name = str(my_lib.time.get_zoneinfo())
+    return _timezone_name
+
+
 @blueprint.route("/api/sysinfo")
 def api_sysinfo() -> flask.Response:
     """システム情報を取得."""
-    import os
-    import platform
-
-    import my_lib.time
-
     now = my_lib.time.now()
 
     # イメージビルド日時（環境変数から取得）
@@ -1564,7 +1671,7 @@ def api_sysinfo() -> flask.Response:
     return flask.jsonify(
         {
             "date": now.isoformat(),
-            "timezone": str(my_lib.time.get_zoneinfo()),
+            "timezone": _get_timezone_name(),
             "image_build_date": image_build_date,
             "load_average": load_average,
         }
@@ -6,6 +6,8 @@ Argon2id を使用したパスワードハッシュの生成と検証を提供
     echo "your_password" | uv run python -m price_watch.webapi.password
 """
 
+import threading
+
 import argon2
 
 # Argon2 ハッシャー（OWASP 推奨パラメータ）
@@ -18,6 +20,12 @@ _hasher = argon2.PasswordHasher(
     salt_len=16,  # ソルト長
 )
 
+# 同時検証数の上限
+# 検証1回ごとに memory_cost 分（64MB）のメモリを確保するため、
+# 同時リクエストが集中した際のメモリ使用量を抑える
+_VERIFY_CONCURRENCY = 2
+_verify_semaphore = threading.BoundedSemaphore(_VERIFY_CONCURRENCY)
+
 
 def generate_hash(password: str) -> str:
     """パスワードから Argon2id ハッシュを生成.
@@ -42,7 +50,8 @@ def verify_password(password: str, password_hash: str) -> bool:
         一致する場合 True
     """
     try:
-        _hasher.verify(password_hash, password)
+        with _verify_semaphore:
+            _hasher.verify(password_hash, password)
         return True
     except argon2.exceptions.VerifyMismatchError:
         return False
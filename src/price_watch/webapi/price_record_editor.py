@@ -21,11 +21,16 @@ blueprint = flask.Blueprint("price_record_editor", __name__)
 
 
 def _get_client_ip() -> str:
-    """クライアントIPアドレスを取得（プロキシ対応）."""
-    forwarded_for = flask.request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    return flask.request.remote_addr or "unknown"
+    """クライアントIPアドレスを取得（プロキシ対応、flask.g にキャッシュ）."""
+    client_ip: str | None = flask.g.get("_client_ip")
+    if client_ip is None:
+        forwarded_for = flask.request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            client_ip = forwarded_for.partition(",")[0].strip()
+        else:
+            client_ip = flask.request.remote_addr or "unknown"
+        flask.g._client_ip = client_ip
+    return client_ip
 
 
 # === Pydantic スキーマ ===
@@ -2,12 +2,12 @@
 """Pydantic schemas for Web API."""
 
 from price_watch.webapi.schemas.items import (
+    PERIOD_VALIDATOR,
     ErrorResponse,
     EventsQueryParams,
-    HistoryQueryParams,
     HistoryResponse,
+    HistoryResponseStruct,
     ItemEventsQueryParams,
-    ItemsQueryParams,
     ItemsResponse,
     MetricsCrawlTimeQueryParams,
     MetricsFailuresQueryParams,
@@ -17,6 +17,7 @@ from price_watch.webapi.schemas.items import (
     MetricsStoresQueryParams,
     Period,
     PriceHistoryPoint,
+    PriceHistoryPointStruct,
     ResultItem,
     StoreDefinition,
     StoreEntry,
@@ -45,17 +46,17 @@ __all__ = [
     "ACTION_TYPES",
     "CHECK_METHODS",
     "CHECK_METHOD_REQUIRED_FIELDS",
+    "PERIOD_VALIDATOR",
     "ActionStepSchema",
     "CheckItemRequest",
     "CheckItemResponse",
     "CheckJobStatus",
     "ErrorResponse",
     "EventsQueryParams",
-    "HistoryQueryParams",
     "HistoryResponse",
+    "HistoryResponseStruct",
     "ItemDefinitionSchema",
     "ItemEventsQueryParams",
-    "ItemsQueryParams",
     "ItemsResponse",
     "MetricsCrawlTimeQueryParams",
     "MetricsFailuresQueryParams",
@@ -66,6 +67,7 @@ __all__ = [
     "Period",
     "PreloadConfigSchema",
     "PriceHistoryPoint",
+    "PriceHistoryPointStruct",
     "ResultItem",
     "StoreDefinition",
     "StoreDefinitionSchema",
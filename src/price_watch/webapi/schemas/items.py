@@ -8,34 +8,34 @@ ensuring type safety and validation for API requests and responses.
 Frontend types are defined in: frontend/src/types/index.ts
 """
 
-from typing import Literal
+from typing import Literal, get_args
 
+import msgspec
 from my_lib.pydantic.base import BaseSchema
-from pydantic import Field
+from pydantic import ConfigDict, Field
+from pydantic_core import SchemaValidator, core_schema
 
 # Period type matching frontend's Period type
 Period = Literal["30", "90", "180", "365", "all"]
 
+# Validator for the `days` query parameter of /api/items and
+# /api/items/<url_hash>/history (frontend's fetchItems / fetchItemHistory).
+# Built once at import time directly on pydantic-core (no TypeAdapter layer)
+# and shared by both endpoints.
+PERIOD_VALIDATOR = SchemaValidator(core_schema.literal_schema(expected=list(get_args(Period))))
 
-class ItemsQueryParams(BaseSchema):
-    """Query parameters for /api/items endpoint.
 
-    Matches frontend's fetchItems(days: Period) call.
-    """
-
-    days: Period = "30"
-
-
-class HistoryQueryParams(BaseSchema):
-    """Query parameters for /api/items/<url_hash>/history endpoint.
+class ResponseSchema(BaseSchema):
+    """Base class for response-only schemas.
 
-    Matches frontend's fetchItemHistory(urlHash, days: Period) call.
+    Responses are built once from trusted data and never modified afterwards,
+    so they are frozen and ignore unknown fields.
     """
 
-    days: Period = "30"
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
 
 
-class PriceHistoryPoint(BaseSchema):
+class PriceHistoryPoint(ResponseSchema):
     """Price history entry.
 
     Matches frontend's PriceHistoryPoint interface.
@@ -48,7 +48,7 @@ class PriceHistoryPoint(BaseSchema):
     stock: int | None
 
 
-class StoreEntry(BaseSchema):
+class StoreEntry(ResponseSchema):
     """Store information for an item.
 
     Matches frontend's StoreEntry interface.
@@ -71,7 +71,7 @@ class StoreEntry(BaseSchema):
     price_unit: str = "円"  # 価格の通貨単位
 
 
-class ResultItem(BaseSchema):
+class ResultItem(ResponseSchema):
     """Item result with multiple stores.
 
     Matches frontend's Item interface.
@@ -86,7 +86,7 @@ class ResultItem(BaseSchema):
     category: str = "その他"
 
 
-class StoreDefinition(BaseSchema):
+class StoreDefinition(ResponseSchema):
     """Store definition with point rate and color.
 
     Matches frontend's StoreDefinition interface.
@@ -99,7 +99,7 @@ class StoreDefinition(BaseSchema):
     currency_rate: float = 1.0  # 円への換算レート（例: ドル→円なら 150.0）
 
 
-class ItemsResponse(BaseSchema):
+class ItemsResponse(ResponseSchema):
     """Response for /api/items endpoint.
 
     Matches frontend's ItemsResponse interface.
@@ -111,7 +111,7 @@ class ItemsResponse(BaseSchema):
     check_interval_sec: int = 1800  # 監視間隔（秒）- ツールチップ表示用
 
 
-class HistoryResponse(BaseSchema):
+class HistoryResponse(ResponseSchema):
     """Response for /api/items/<url_hash>/history endpoint.
 
     Matches frontend's HistoryResponse interface.
@@ -120,6 +120,24 @@ class HistoryResponse(BaseSchema):
     history: list[PriceHistoryPoint]
 
 
+# === msgpack レスポンス用（内部クライアント向け） ===
+
+
+class PriceHistoryPointStruct(msgspec.Struct):
+    """msgpack response counterpart of PriceHistoryPoint."""
+
+    time: str
+    price: int | None
+    effective_price: int | None
+    stock: int | None
+
+
+class HistoryResponseStruct(msgspec.Struct):
+    """msgpack response counterpart of HistoryResponse."""
+
+    history: list[PriceHistoryPointStruct]
+
+
 class ErrorResponse(BaseSchema):
     """Error response."""
 
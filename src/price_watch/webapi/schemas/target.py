@@ -7,11 +7,11 @@ ensuring type safety and validation for API requests and responses.
 """
 
 from my_lib.pydantic.base import BaseSchema
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 # === チェックメソッド定義 ===
 # target.py の CheckMethod enum に対応
-CHECK_METHODS = [
+CHECK_METHODS: tuple[str, ...] = (
     "scrape",
     "my_lib.store.amazon.api",
     "my_lib.store.mercari.search",
@@ -20,10 +20,10 @@ CHECK_METHODS = [
     "my_lib.store.yahoo.api",
     "my_lib.store.rakuten.api",
     "my_lib.store.yodobashi.scrape",
-]
+)
 
 # === アクションタイプ定義 ===
-ACTION_TYPES = ["click", "input", "sixdigit", "recaptcha"]
+ACTION_TYPES: tuple[str, ...] = ("click", "input", "sixdigit", "recaptcha")
 
 # === check_method ごとの必須フィールド定義 ===
 # バリデーション時に参照する
@@ -33,10 +33,10 @@ ACTION_TYPES = ["click", "input", "sixdigit", "recaptcha"]
 #
 # Note: XPath 系フィールドはストア定義またはアイテムのストアエントリで指定可能
 #       ストア定義で指定されていればアイテム側では省略可能
-CHECK_METHOD_REQUIRED_FIELDS: dict[str, list[str]] = {
-    "scrape": ["url", "price_xpath", "unavailable_xpath", "thumb_img_xpath"],
-    "my_lib.store.amazon.api": ["url_or_asin"],
-    "my_lib.store.yodobashi.scrape": ["url"],
+CHECK_METHOD_REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    "scrape": ("url", "price_xpath", "unavailable_xpath", "thumb_img_xpath"),
+    "my_lib.store.amazon.api": ("url_or_asin",),
+    "my_lib.store.yodobashi.scrape": ("url",),
     # 検索系は URL/ASIN 不要（検索結果から動的に取得）
     # "my_lib.store.mercari.search": [],
     # "my_lib.store.rakuma.search": [],
@@ -49,7 +49,17 @@ CHECK_METHOD_REQUIRED_FIELDS: dict[str, list[str]] = {
 # === リクエスト/レスポンス用スキーマ ===
 
 
-class ActionStepSchema(BaseSchema):
+class EditorSchema(BaseSchema):
+    """エディタ API 用スキーマの基底クラス.
+
+    エディタ系エンドポイントは利用頻度が低いため、コアスキーマの構築を
+    import 時ではなく初回のバリデーション時まで遅延させて起動を速くする。
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class ActionStepSchema(EditorSchema):
     """アクションステップ."""
 
     type: str = Field(..., description="アクションタイプ (click, input, sixdigit, recaptcha)")
@@ -57,14 +67,14 @@ class ActionStepSchema(BaseSchema):
     value: str | None = Field(default=None, description="入力値（input タイプの場合）")
 
 
-class PreloadConfigSchema(BaseSchema):
+class PreloadConfigSchema(EditorSchema):
     """プリロード設定."""
 
     url: str = Field(..., description="プリロード URL")
     every: int = Field(default=1, ge=1, description="何アイテムおきにプリロードするか")
 
 
-class StoreDefinitionSchema(BaseSchema):
+class StoreDefinitionSchema(EditorSchema):
     """ストア定義."""
 
     name: str = Field(..., min_length=1, description="ストア名")
@@ -79,7 +89,7 @@ class StoreDefinitionSchema(BaseSchema):
     affiliate_id: str | None = Field(default=None, description="アフィリエイトID")
 
 
-class StoreEntrySchema(BaseSchema):
+class StoreEntrySchema(EditorSchema):
     """アイテムのストアエントリ（新書式用）."""
 
     name: str = Field(..., min_length=1, description="ストア名")
@@ -98,7 +108,7 @@ class StoreEntrySchema(BaseSchema):
     jan_code: str | None = Field(default=None, description="JANコード（Yahoo検索用）")
 
 
-class ItemDefinitionSchema(BaseSchema):
+class ItemDefinitionSchema(EditorSchema):
     """アイテム定義."""
 
     name: str = Field(..., min_length=1, description="アイテム名")
@@ -110,7 +120,7 @@ class ItemDefinitionSchema(BaseSchema):
     store: list[StoreEntrySchema] = Field(..., min_length=1, description="ストアリスト")
 
 
-class TargetConfigSchema(BaseSchema):
+class TargetConfigSchema(EditorSchema):
     """ターゲット設定（target.yaml）."""
 
     category_list: list[str] = Field(default_factory=list, description="カテゴリー表示順")
@@ -121,16 +131,16 @@ class TargetConfigSchema(BaseSchema):
 # === API レスポンス ===
 
 
-class TargetConfigResponse(BaseSchema):
+class TargetConfigResponse(EditorSchema):
     """GET /api/target のレスポンス."""
 
     config: TargetConfigSchema
-    check_methods: list[str] = Field(default_factory=lambda: CHECK_METHODS)
-    action_types: list[str] = Field(default_factory=lambda: ACTION_TYPES)
+    check_methods: list[str] = Field(default_factory=lambda: list(CHECK_METHODS))
+    action_types: list[str] = Field(default_factory=lambda: list(ACTION_TYPES))
     require_password: bool = Field(default=False, description="保存時にパスワードが必要か")
 
 
-class TargetUpdateRequest(BaseSchema):
+class TargetUpdateRequest(EditorSchema):
     """PUT /api/target のリクエスト."""
 
     config: TargetConfigSchema
@@ -138,7 +148,7 @@ class TargetUpdateRequest(BaseSchema):
     password: str | None = Field(default=None, description="認証パスワード")
 
 
-class TargetUpdateResponse(BaseSchema):
+class TargetUpdateResponse(EditorSchema):
     """PUT /api/target のレスポンス."""
 
     success: bool = Field(..., description="保存成功かどうか")
@@ -146,34 +156,34 @@ class TargetUpdateResponse(BaseSchema):
     git_commit_url: str | None = Field(default=None, description="コミット URL")
 
 
-class ValidationError(BaseSchema):
+class ValidationError(EditorSchema):
     """バリデーションエラー詳細."""
 
     path: str = Field(..., description="エラー箇所のパス")
     message: str = Field(..., description="エラーメッセージ")
 
 
-class ValidateResponse(BaseSchema):
+class ValidateResponse(EditorSchema):
     """POST /api/target/validate のレスポンス."""
 
     valid: bool
     errors: list[ValidationError] = Field(default_factory=list)
 
 
-class CheckItemRequest(BaseSchema):
+class CheckItemRequest(EditorSchema):
     """POST /api/target/check-item のリクエスト."""
 
     item_name: str = Field(..., description="アイテム名")
     store_name: str = Field(..., description="ストア名")
 
 
-class CheckItemResponse(BaseSchema):
+class CheckItemResponse(EditorSchema):
     """POST /api/target/check-item のレスポンス."""
 
     job_id: str = Field(..., description="ジョブID")
 
 
-class CheckJobStatus(BaseSchema):
+class CheckJobStatus(EditorSchema):
     """チェックジョブのステータス."""
 
     job_id: str
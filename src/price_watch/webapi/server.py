@@ -11,24 +11,43 @@ Options:
   -D                : デバッグモードで動作します。
 """
 
+import functools
+import hashlib
 import logging
 import pathlib
+import socket
 import sqlite3
 import threading
+import time
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
 
 import flask
 import flask.typing
-import flask_cors
 import my_lib.webapp.base
 import my_lib.webapp.config
 import my_lib.webapp.event
 import my_lib.webapp.util
+import watchfiles
 import werkzeug.exceptions
 import werkzeug.serving
 
+import price_watch.webapi.compression
+import price_watch.webapi.cors
+
 URL_PREFIX = "/price"
+# API エンドポイントのパスプレフィックス（リクエストごとに文字列を組み立てないよう事前に計算）
+_API_PATH_PREFIX = f"{URL_PREFIX}/api/"
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_origin(external_url: str) -> str | None:
+    """external_url からオリジン（scheme://netloc）を抽出（URL ごとに一度だけ解析）."""
+    parsed = urllib.parse.urlparse(external_url)
+    if not parsed.scheme or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
 
 
 def _get_cors_origins(external_url: str | None) -> list[str] | str:
@@ -43,19 +62,20 @@ def _get_cors_origins(external_url: str | None) -> list[str] | str:
     if not external_url:
         return "*"  # 未設定時は全許可（後方互換）
 
-    parsed = urllib.parse.urlparse(external_url)
-    if not parsed.scheme or not parsed.netloc:
+    origin = _parse_origin(external_url)
+    if origin is None:
         logging.warning("Invalid external_url format: %s, allowing all origins", external_url)
         return "*"
 
-    origin = f"{parsed.scheme}://{parsed.netloc}"
     logging.info("CORS origin restricted to: %s", origin)
     return [origin]
 
 
-@dataclass(frozen=True)
-class _MetricsDataState:
-    """メトリクス DB データ状態（変化検出用）."""
+class _MetricsDataState(NamedTuple):
+    """メトリクス DB データ状態（変化検出用）.
+
+    DB 変更通知のたびに前回の状態と比較するため、比較がタプル比較で済む NamedTuple にしている。
+    """
 
     has_active_session: bool
     is_crawling: bool
@@ -67,39 +87,155 @@ class _MetricsDataState:
 _watch_thread: threading.Thread | None = None
 _watch_stop_event: threading.Event | None = None
 
+# 状態取得用の読み取り専用接続（変更通知のたびに接続し直さないよう使い回す）
+_state_conn: sqlite3.Connection | None = None
+# 接続を開いた時点の DB ファイルの (st_dev, st_ino)（DB の削除・再作成の検出用）
+_state_conn_file_id: tuple[int, int] | None = None
+_state_conn_lock = threading.Lock()
+
+# 状態取得用接続でメモリマップする最大サイズ（バイト）
+_STATE_CONN_MMAP_SIZE = 256 * 1024 * 1024
+
+# 実行中セッションの状態取得クエリ
+# 同一接続・同一 SQL 文字列のため、sqlite3 のステートメントキャッシュが効く
+_ACTIVE_SESSION_STATE_SQL = """
+    SELECT last_heartbeat_at, work_ended_at, total_items
+    FROM crawl_sessions
+    WHERE ended_at IS NULL
+    ORDER BY started_at DESC
+    LIMIT 1
+"""
+
+
+def _open_state_conn(db_path: pathlib.Path) -> sqlite3.Connection:
+    """状態取得用の読み取り専用接続を開く."""
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA query_only=1")
+    # DB をメモリマップして read() システムコールを経由せずに読み取る
+    conn.execute(f"PRAGMA mmap_size={_STATE_CONN_MMAP_SIZE}")
+    return conn
+
+
+def _close_state_conn() -> None:
+    """状態取得用の接続を閉じる."""
+    with _state_conn_lock:
+        _close_state_conn_locked()
+
+
+def _close_state_conn_locked() -> None:
+    """状態取得用の接続を閉じる（_state_conn_lock を保持した状態で呼び出す）."""
+    global _state_conn, _state_conn_file_id
+    if _state_conn is not None:
+        _state_conn.close()
+        _state_conn = None
+    _state_conn_file_id = None
+
 
 def _get_metrics_data_state(db_path: pathlib.Path) -> _MetricsDataState | None:
     """メトリクス DB のデータ状態を取得."""
+    global _state_conn, _state_conn_file_id
+    try:
+        stat = db_path.stat()
+    except FileNotFoundError:
+        # DB がまだ作成されていない（または削除された）場合は状態なしとして扱う
+        _close_state_conn()
+        return None
+    file_id = (stat.st_dev, stat.st_ino)
+
     try:
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT last_heartbeat_at, work_ended_at, total_items
-                FROM crawl_sessions
-                WHERE ended_at IS NULL
-                ORDER BY started_at DESC
-                LIMIT 1
-                """
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return _MetricsDataState(
-                    has_active_session=False,
-                    is_crawling=False,
-                    last_heartbeat_at=None,
-                    total_items=0,
-                )
-            heartbeat_str, work_ended_at_str, total_items = row
-            return _MetricsDataState(
-                has_active_session=True,
-                is_crawling=work_ended_at_str is None,
-                last_heartbeat_at=heartbeat_str,
-                total_items=total_items or 0,
-            )
+        with _state_conn_lock:
+            if _state_conn is not None and _state_conn_file_id != file_id:
+                # DB が削除・再作成された場合、古い接続は削除済みのファイルを読み続けるため開き直す
+                _close_state_conn_locked()
+            if _state_conn is None:
+                _state_conn = _open_state_conn(db_path)
+                _state_conn_file_id = file_id
+            row = _state_conn.execute(_ACTIVE_SESSION_STATE_SQL).fetchone()
     except Exception:
         logging.exception("Error getting metrics data state")
+        # 次回呼び出し時に接続し直す
+        _close_state_conn()
         return None
 
+    if row is None:
+        return _MetricsDataState(
+            has_active_session=False,
+            is_crawling=False,
+            last_heartbeat_at=None,
+            total_items=0,
+        )
+    heartbeat_str, work_ended_at_str, total_items = row
+    return _MetricsDataState(
+        has_active_session=True,
+        is_crawling=work_ended_at_str is None,
+        last_heartbeat_at=heartbeat_str,
+        total_items=total_items or 0,
+    )
+
+
+# 変更通知がなくても状態を再確認する間隔（ネットワークファイルシステム等での通知取りこぼし対策）
+_WATCH_HOUSEKEEPING_MS = 10_000
+# 連続した変更通知をまとめる待ち時間（この間に次の通知がなければ 1 回の再確認にまとめる）
+_WATCH_STEP_MS = 100
+# 書き込みが途切れない場合でも、この間隔で少なくとも 1 回は再確認する
+_WATCH_DEBOUNCE_MS = 1_000
+
+
+def _watch_db_state(db_path: pathlib.Path, stop_event: threading.Event) -> None:
+    """メトリクス DB の変更をカーネルのファイル変更通知で待ち受け、状態変化を SSE で通知.
+
+    定期的に stat() するのではなく inotify 等の通知を待つため、アイドル時の起床は
+    通知の取りこぼし対策として _WATCH_HOUSEKEEPING_MS ごとに状態を再確認するときだけです。
+    WAL モードでは書き込みが -wal ファイルに入るため、ジャーナルファイルも監視対象にします。
+    クローラーの連続書き込みによる通知は _WATCH_STEP_MS 単位でまとめ、
+    SELECT と SSE 送信をバーストごとに 1 回に抑えます。
+    """
+    watch_names = {db_path.name, f"{db_path.name}-wal", f"{db_path.name}-journal"}
+
+    def _is_db_file(_change: watchfiles.Change, path: str) -> bool:
+        return pathlib.Path(path).name in watch_names
+
+    last_state = _get_metrics_data_state(db_path)
+    while _wait_for_directory(db_path.parent, stop_event):
+        try:
+            for _changes in watchfiles.watch(
+                db_path.parent,
+                watch_filter=_is_db_file,
+                stop_event=stop_event,
+                recursive=False,
+                debounce=_WATCH_DEBOUNCE_MS,
+                step=_WATCH_STEP_MS,
+                rust_timeout=_WATCH_HOUSEKEEPING_MS,
+                yield_on_timeout=True,
+            ):
+                state = _get_metrics_data_state(db_path)
+                if state is None or state == last_state:
+                    continue
+                last_state = state
+                my_lib.webapp.event.notify_event(my_lib.webapp.event.EVENT_TYPE.CONTROL)
+        except FileNotFoundError:
+            # 監視中にディレクトリが削除された場合は、再作成されるのを待って監視を再開する
+            continue
+        # watch() が正常に終了するのは stop_event がセットされたときだけ
+        return
+
+
+def _wait_for_directory(dir_path: pathlib.Path, stop_event: threading.Event) -> bool:
+    """ディレクトリが作成されるまで待機.
+
+    Returns:
+        ディレクトリが存在する場合は True、待機中に停止要求があった場合は False
+    """
+    if dir_path.is_dir():
+        return not stop_event.is_set()
+
+    logging.warning("Metrics db directory not found, waiting for creation: %s", dir_path)
+    while not stop_event.wait(_WATCH_HOUSEKEEPING_MS / 1000):
+        if dir_path.is_dir():
+            logging.info("Metrics db directory created: %s", dir_path)
+            return True
+    return False
+
 
 def start_db_watcher(db_path: pathlib.Path) -> None:
     """メトリクス DB ファイル監視スレッドを開始."""
@@ -107,11 +243,14 @@ def start_db_watcher(db_path: pathlib.Path) -> None:
     if _watch_thread is not None and _watch_thread.is_alive():
         stop_db_watcher()
 
-    _watch_stop_event, _watch_thread = my_lib.webapp.event.start_db_state_watcher(
-        db_path,
-        _get_metrics_data_state,
-        my_lib.webapp.event.EVENT_TYPE.CONTROL,
+    _watch_stop_event = threading.Event()
+    _watch_thread = threading.Thread(
+        target=_watch_db_state,
+        args=(db_path, _watch_stop_event),
+        name="metrics-db-watcher",
+        daemon=True,
     )
+    _watch_thread.start()
     logging.info("Metrics db watcher thread started")
 
 
@@ -121,13 +260,135 @@ def stop_db_watcher() -> None:
     if _watch_thread is None or _watch_stop_event is None:
         return
 
-    my_lib.webapp.event.stop_db_state_watcher(_watch_stop_event, _watch_thread)
+    _watch_stop_event.set()
+    _watch_thread.join(timeout=5)
+    _close_state_conn()
     _watch_thread = None
     _watch_stop_event = None
     logging.info("Metrics db watcher thread stopped")
 
 
 @dataclass
+class _ErrorLogSampler:
+    """例外ログのサンプリング（トークンバケット）.
+
+    例外が連続して発生した場合にトレースバックの整形・出力コストが膨らまないよう、
+    トレースバック付きのログを平均 rate 件/秒（連続 burst 件まで）に制限します。
+    """
+
+    rate: float = 1.0
+    burst: float = 10.0
+    _tokens: float = field(default=0.0, init=False)
+    _last_time: float = field(default=0.0, init=False)
+    _suppressed: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __post_init__(self) -> None:
+        """バケットを満タンにして開始."""
+        self._tokens = self.burst
+        self._last_time = time.monotonic()
+
+    def acquire(self) -> int | None:
+        """トレースバックを出力してよいか判定.
+
+        Returns:
+            出力してよい場合は直前までに抑制した件数、抑制する場合は None
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_time) * self.rate)
+            self._last_time = now
+            if self._tokens < 1.0:
+                self._suppressed += 1
+                return None
+            self._tokens -= 1.0
+            suppressed, self._suppressed = self._suppressed, 0
+            return suppressed
+
+
+_error_log_sampler = _ErrorLogSampler()
+
+# 500 エラーの本文（固定内容のため事前にシリアライズしておく）
+# NOTE: Response オブジェクトは after_request でヘッダーが書き換えられるため共有せず、本文のみ使い回す
+_INTERNAL_ERROR_BODY = b'{"error":"Internal Server Error"}\n'
+
+
+def _internal_error_response() -> flask.Response:
+    """500 エラーレスポンスを生成."""
+    return flask.Response(_INTERNAL_ERROR_BODY, status=500, mimetype="application/json")
+
+
+def _log_unhandled_exception(message: str, error: Exception) -> None:
+    """未処理例外をログ出力（トレースバックはサンプリング）."""
+    suppressed = _error_log_sampler.acquire()
+    if suppressed is None:
+        logging.error("%s (traceback suppressed): %s: %s", message, type(error).__name__, error)
+        return
+    if suppressed:
+        logging.warning("Suppressed tracebacks of %d exceptions", suppressed)
+    logging.exception("%s: %s", message, error)
+
+
+# 圧縮する最小サイズ（これより小さい本文は圧縮しても効果が薄い）
+_COMPRESS_MIN_SIZE = 1024
+
+
+def _compress_response(response: flask.Response) -> None:
+    """Accept-Encoding に応じて API レスポンスの本文を圧縮.
+
+    圧縮済み（事前圧縮された価格履歴など）・SSE・ファイル送信のレスポンスは対象外です。
+    ストリーミングレスポンスはチャンクごとに圧縮します。
+    """
+    if response.content_encoding or response.direct_passthrough or response.mimetype == "text/event-stream":
+        return
+    encoding = flask.request.accept_encodings.best_match(price_watch.webapi.compression.ENCODINGS)
+    if encoding is None:
+        return
+
+    if response.is_streamed:
+        response.response = price_watch.webapi.compression.compress_stream(response.response, encoding)
+    else:
+        data = response.get_data()
+        if len(data) < _COMPRESS_MIN_SIZE:
+            return
+        response.set_data(price_watch.webapi.compression.compress(data, encoding))
+    response.content_encoding = encoding
+    response.vary.add("Accept-Encoding")
+
+
+# API レスポンスの Cache-Control
+# 1時間キャッシュし、期限切れ後も1日間は裏で再検証しながら古い内容を返せるようにする
+# （サーバーエラー時は5分間まで古い内容で代替可）
+_API_CACHE_CONTROL = "public, max-age=3600, stale-while-revalidate=86400, stale-if-error=300"
+
+# 編集・検索・動作確認の API はキャッシュさせない
+_NO_STORE_BLUEPRINTS = frozenset(
+    {"target_editor", "price_record_editor", "check_job", "amazon_search", "yodobashi_search"}
+)
+
+
+# listen() のバックログ（接続が集中した際に SYN を取りこぼさないよう werkzeug 既定の 128 より大きくする）
+_LISTEN_BACKLOG = 1024
+
+
+class _WebUIServer(werkzeug.serving.ThreadedWSGIServer):
+    """WebUI 用の WSGI サーバー.
+
+    SSE（/api/event や動作確認ジョブの進捗）は接続を開いたまま保持し続けるため、
+    固定数のワーカーで処理すると他のリクエストが待たされます。
+    ThreadedWSGIServer と同じく接続ごとにスレッドで処理します。
+    """
+
+    request_queue_size = _LISTEN_BACKLOG
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """受け付けた接続を新しいスレッドで処理する."""
+        # 小さな SSE イベントや API レスポンスが Nagle アルゴリズムで遅延しないようにする
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().process_request(request, client_address)
+
+
+@dataclass(slots=True)
 class ServerHandle:
     """サーバーハンドル."""
 
@@ -139,6 +400,8 @@ def create_app(
     static_dir_path: pathlib.Path,
     config_file: pathlib.Path | None = None,
     target_file: pathlib.Path | None = None,
+    *,
+    debug_mode: bool = False,
 ) -> flask.Flask:
     """Flask アプリケーションを作成.
 
@@ -146,12 +409,14 @@ def create_app(
         static_dir_path: フロントエンドの静的ファイルディレクトリパス（frontend/dist）
         config_file: 設定ファイルパス（指定時にキャッシュパスを更新）
         target_file: ターゲット設定ファイルパス（指定時にキャッシュパスを更新）
+        debug_mode: デバッグモード（指定時にルーティング一覧をログ出力）
 
     Raises:
         RuntimeError: config.yaml の読み込みに失敗した場合
     """
     import price_watch.webapi.amazon_search
     import price_watch.webapi.check_job
+    import price_watch.webapi.json_provider
     import price_watch.webapi.page
     import price_watch.webapi.price_record_editor
     import price_watch.webapi.target_editor
@@ -169,6 +434,8 @@ def create_app(
     my_lib.webapp.config.STATIC_DIR_PATH = static_dir_path
 
     app = flask.Flask("price_watch_webui")
+    # JSON シリアライズは orjson で行う（価格履歴を含む大きなレスポンスの高速化）
+    app.json = price_watch.webapi.json_provider.ORJSONProvider(app)
 
     # config.yaml の読み込み（必須）
     # 読み込み失敗時は例外が発生し、サーバー起動が停止する
@@ -180,18 +447,35 @@ def create_app(
         raise RuntimeError(msg)
 
     # CORS 設定: external_url が設定されていればそのオリジンのみ許可
+    # 静的ファイルや HTML ページには不要なため、API エンドポイントに限定する
     external_url = app_config.webapp.external_url
     cors_origins = _get_cors_origins(external_url)
-    flask_cors.CORS(app, origins=cors_origins)
-
-    app.json.compat = True  # type: ignore[attr-defined]
+    app.wsgi_app = price_watch.webapi.cors.CorsMiddleware(  # type: ignore[method-assign]
+        app.wsgi_app, _API_PATH_PREFIX, cors_origins
+    )
 
     @app.after_request
     def add_cache_control_headers(response: flask.Response) -> flask.Response:
         """API レスポンスにキャッシュ制御ヘッダーを追加."""
-        # API エンドポイントは1時間キャッシュ
-        if flask.request.path.startswith(f"{URL_PREFIX}/api/"):
-            response.headers["Cache-Control"] = "public, max-age=3600"
+        if not flask.request.path.startswith(_API_PATH_PREFIX):
+            return response
+        _compress_response(response)
+        # ストリーミング等でエンドポイント側が明示的に指定している場合はそのまま
+        if "Cache-Control" in response.headers:
+            return response
+        if (
+            flask.request.method not in ("GET", "HEAD")
+            or flask.request.blueprint in _NO_STORE_BLUEPRINTS
+            or response.status_code >= 400
+        ):
+            response.headers["Cache-Control"] = "no-store"
+        else:
+            response.headers["Cache-Control"] = _API_CACHE_CONTROL
+            # 本文のハッシュを ETag とし、If-None-Match が一致すれば 304 で本文を省略
+            # （ストリーミングレスポンスは本文を読み切れないため対象外）
+            if response.status_code == 200 and not response.is_streamed:
+                response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+                response.make_conditional(flask.request)
         return response
 
     # ブループリント登録
@@ -219,8 +503,8 @@ def create_app(
     @app.errorhandler(500)
     def handle_internal_error(error: Exception) -> flask.typing.ResponseReturnValue:
         """Handle internal server errors."""
-        logging.exception("Internal server error: %s", error)
-        return flask.jsonify({"error": "Internal Server Error"}), 500
+        _log_unhandled_exception("Internal server error", error)
+        return _internal_error_response()
 
     @app.errorhandler(Exception)
     def handle_exception(error: Exception) -> flask.typing.ResponseReturnValue:
@@ -228,10 +512,12 @@ def create_app(
         # HTTPException はそのまま処理（Response に変換して返す）
         if isinstance(error, werkzeug.exceptions.HTTPException):
             return error.get_response()
-        logging.exception("Unhandled exception: %s", error)
-        return flask.jsonify({"error": "Internal Server Error"}), 500
+        _log_unhandled_exception("Unhandled exception", error)
+        return _internal_error_response()
 
-    my_lib.webapp.config.show_handler_list(app)
+    # ルーティング一覧の出力は全ルートを走査するため、デバッグ時のみ行う
+    if debug_mode:
+        my_lib.webapp.config.show_handler_list(app)
 
     return app
 
@@ -242,6 +528,8 @@ def start(
     metrics_db_path: pathlib.Path | None = None,
     config_file: pathlib.Path | None = None,
     target_file: pathlib.Path | None = None,
+    *,
+    debug_mode: bool = False,
 ) -> ServerHandle:
     """サーバーを開始.
 
@@ -251,14 +539,17 @@ def start(
         metrics_db_path: メトリクス DB パス（指定時に DB ウォッチャーを開始）
         config_file: 設定ファイルパス
         target_file: ターゲット設定ファイルパス
+        debug_mode: デバッグモード
     """
     import price_watch.webapi.cache
 
-    server = werkzeug.serving.make_server(
+    # NOTE: 動作確認ジョブ・SSE 通知・ヨドバシ検索用 WebDriver・各種キャッシュはプロセス内の
+    # 状態として保持しているため、マルチプロセスの WSGI サーバー（gunicorn 等）には移行せず、
+    # 同一プロセス内のスレッドでリクエストを処理する
+    server = _WebUIServer(
         "0.0.0.0",  # noqa: S104
         port,
-        create_app(static_dir_path, config_file=config_file, target_file=target_file),
-        threaded=True,
+        create_app(static_dir_path, config_file=config_file, target_file=target_file, debug_mode=debug_mode),
     )
     thread = threading.Thread(target=server.serve_forever, daemon=True)
 
@@ -319,7 +610,7 @@ def main() -> None:
         logging.warning("Static directory not found: %s", static_dir_path)
         logging.warning("Run 'cd frontend && npm run build' to build the frontend")
 
-    server_handle = start(port, static_dir_path=static_dir_path)
+    server_handle = start(port, static_dir_path=static_dir_path, debug_mode=debug_mode)
 
     try:
         server_handle.thread.join()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""文字列プールによるレスポンスの圧縮.
+
+アイテム一覧レスポンスでは、ストア名・カテゴリー名・通貨単位などの
+同じ文字列が多数のエントリで繰り返されます。これらの値を先頭の
+文字列テーブル（strings）へのインデックスに置き換えることで
+ペイロードを削減します。
+
+対応するデコーダーは frontend/src/utils/stringPool.ts にあります。
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# パック形式のレスポンスの MIME タイプ（Accept ヘッダーで要求された場合のみ使用）
+PACKED_MIMETYPE = "application/vnd.pricewatch.packed+json"
+
+# 文字列テーブルに置き換えるキー（値が文字列の場合のみ対象）
+# NOTE: frontend/src/utils/stringPool.ts の PACKED_KEYS と一致させること
+PACKED_KEYS: frozenset[str] = frozenset({"store", "best_store", "category", "price_unit"})
+
+
+def _pack_value(value: Any, pool: dict[str, int]) -> Any:
+    """値を再帰的に走査し、対象キーの文字列をインデックスに置き換える."""
+    if isinstance(value, dict):
+        return {
+            key: (
+                pool.setdefault(v, len(pool))
+                if key in PACKED_KEYS and isinstance(v, str)
+                else _pack_value(v, pool)
+            )
+            for key, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_pack_value(v, pool) for v in value]
+    return value
+
+
+def pack(data: dict[str, Any]) -> dict[str, Any]:
+    """レスポンスを文字列プール形式に変換.
+
+    Args:
+        data: JSON 互換の dict（model_dump(mode="json") の結果など）
+
+    Returns:
+        先頭に strings テーブルを持つ dict
+    """
+    pool: dict[str, int] = {}
+    packed = _pack_value(data, pool)
+    # dict は挿入順を保持するため、キーの並びがそのままインデックス順になる
+    return {"strings": list(pool), **packed}
+
+
+def unpack(data: dict[str, Any]) -> dict[str, Any]:
+    """文字列プール形式のレスポンスを元の形式に戻す（テスト・デバッグ用）."""
+    strings: list[str] = data["strings"]
+
+    def _unpack_value(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: (strings[v] if key in PACKED_KEYS and isinstance(v, int) else _unpack_value(v))
+                for key, v in value.items()
+            }
+        if isinstance(value, list):
+            return [_unpack_value(v) for v in value]
+        return value
+
+    return _unpack_value({key: value for key, value in data.items() if key != "strings"})
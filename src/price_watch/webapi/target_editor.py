@@ -4,21 +4,26 @@
 target.yaml の読み込み、保存、バリデーションを行う API を提供します。
 """
 
-import io
 import logging
+import operator
+import os
 import pathlib
 import shutil
-from typing import Any
+import stat
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 import flask
 import my_lib.time
-from flask_pydantic import validate
-from ruamel.yaml import YAML
+import pydantic
+import yaml
 
+import price_watch.file_cache
 import price_watch.notify
 import price_watch.webapi.auth_rate_limiter
 import price_watch.webapi.cache
 import price_watch.webapi.git_sync
+import price_watch.webapi.json_provider
 import price_watch.webapi.password
 import price_watch.webapi.schemas
 from price_watch.security.url_guard import UnsafeUrlError, validate_public_url
@@ -27,20 +32,67 @@ blueprint = flask.Blueprint("target_editor", __name__)
 
 
 def _get_client_ip() -> str:
-    """クライアントIPアドレスを取得（プロキシ対応）."""
-    # X-Forwarded-For ヘッダーがある場合は最初のIPを使用
-    forwarded_for = flask.request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        # カンマ区切りの場合、最初のIPが元のクライアント
-        return forwarded_for.split(",")[0].strip()
-    return flask.request.remote_addr or "unknown"
+    """クライアントIPアドレスを取得（プロキシ対応）.
 
+    同一リクエスト内での再計算を避けるため、結果を flask.g にキャッシュします。
+    """
+    client_ip: str | None = flask.g.get("_client_ip")
+    if client_ip is None:
+        # X-Forwarded-For ヘッダーがある場合は最初のIPを使用
+        forwarded_for = flask.request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            # カンマ区切りの場合、最初のIPが元のクライアント（リストを生成せずに切り出す）
+            client_ip = forwarded_for.partition(",")[0].strip()
+        else:
+            client_ip = flask.request.remote_addr or "unknown"
+        flask.g._client_ip = client_ip
+    return client_ip
+
+
+# YAML の読み込みには libyaml（C 実装）を使用する（未ビルド環境では純 Python 実装にフォールバック）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# 保存時に 1 行に収める最大幅（XPath や URL を折り返さない）
+_YAML_WIDTH = 4096
+
+
+class _TargetYamlDumper(yaml.SafeDumper):
+    """target.yaml の既存のレイアウトで出力する Dumper.
+
+    マッピングは 4 スペース、シーケンスは親から 2 スペース下げた位置に "- " を置き、
+    要素の内容を 4 スペースの位置に揃えます（ruamel.yaml の
+    indent(mapping=4, sequence=4, offset=2) と同じ出力）。
+    libyaml の Emitter はインデント幅を変更できないため、保存時は純 Python 実装を使用します。
+    300 アイテムの設定で CSafeDumper の約 14 ms に対して約 60 ms ですが、
+    書き出しは内容が変わった保存時だけのため許容しています。
+    NOTE: 保存するデータはスキーマから生成するため、コメントは保持されません。
+    """
 
-# ruamel.yaml の設定
-_yaml = YAML()
-_yaml.preserve_quotes = True
-_yaml.indent(mapping=4, sequence=4, offset=2)
-_yaml.default_flow_style = False
+    def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:
+        self.indents.append(self.indent)
+        if self.indent is None:
+            self.indent = self.best_indent if flow else 0
+        elif isinstance(self.event, yaml.SequenceStartEvent) or self.sequence_context:
+            # "- " をシーケンスの親から 2 スペース、要素の内容を "- " の直後に揃える
+            self.indent += 2
+        else:
+            self.indent += self.best_indent
+
+
+def _dump_yaml(data: dict[str, Any]) -> str:
+    """設定データを YAML 文字列に変換."""
+    return yaml.dump(
+        data,
+        Dumper=_TargetYamlDumper,
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=False,
+        indent=4,
+        width=_YAML_WIDTH,
+    )
 
 
 def _get_target_file_path() -> pathlib.Path:
@@ -48,41 +100,177 @@ def _get_target_file_path() -> pathlib.Path:
     return price_watch.webapi.cache.get_target_config_cache().file_path
 
 
-def _load_raw_target() -> dict[str, Any]:
+def _read_raw_target(target_path: pathlib.Path) -> dict[str, Any]:
     """target.yaml を生のデータとして読み込む."""
-    target_path = _get_target_file_path()
-    if not target_path.exists():
-        return {"category_list": [], "store_list": [], "item_list": []}
-
     with target_path.open("r", encoding="utf-8") as f:
-        data = _yaml.load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
         return dict(data) if data else {"category_list": [], "store_list": [], "item_list": []}
 
 
-def _save_raw_target(data: dict[str, Any], *, create_backup: bool = True) -> None:
+# 編集用スキーマのキャッシュ（target.yaml の更新時刻が変わるまで YAML の解析とスキーマ構築を省略）
+_schema_cache: price_watch.file_cache.FileCache[price_watch.webapi.schemas.TargetConfigSchema] | None = None
+
+
+def _load_target_schema() -> price_watch.webapi.schemas.TargetConfigSchema:
+    """target.yaml を編集用スキーマとして読み込む（キャッシュ使用）."""
+    global _schema_cache
+    target_path = _get_target_file_path()
+    cache = _schema_cache
+    if cache is None or cache.file_path != target_path:
+        cache = _schema_cache = price_watch.file_cache.FileCache(
+            target_path, lambda path: _convert_raw_to_schema(_read_raw_target(path))
+        )
+
+    config = cache.get()
+    if config is None:
+        return _convert_raw_to_schema({"category_list": [], "store_list": [], "item_list": []})
+    return config
+
+
+def _backup_name(target_path: pathlib.Path, timestamp: str) -> str:
+    """バックアップのファイル名（timestamp に "*" を渡すと検索用のパターン）."""
+    return f"{target_path.name}.bak.{timestamp}"
+
+
+def _remove_old_backups(target_path: pathlib.Path, backup_count: int) -> None:
+    """古いバックアップを削除し、新しいものから backup_count 個だけ残す."""
+    # ファイル名の日時（%Y%m%d_%H%M%S）は文字列順が時系列順になる
+    backups = sorted(target_path.parent.glob(_backup_name(target_path, "*")), reverse=True)
+    for stale in backups[backup_count:]:
+        stale.unlink(missing_ok=True)
+        logging.info("Removed old backup: %s", stale)
+
+
+def _write_file_atomic(target_path: pathlib.Path, data: bytes) -> None:
+    """一時ファイル経由でファイルをアトミックかつ永続的に置き換える.
+
+    一時ファイルの内容を fsync してから rename し、rename 後にディレクトリを fsync することで、
+    電源断などの直後でも空のファイルや置換前の状態に戻らないようにします。
+    """
+    tmp_path = target_path.with_suffix(".yaml.tmp")
+    try:
+        # 既存ファイルのパーミッションを引き継ぐ（新規作成時は umask に従う）
+        mode: int | None = stat.S_IMODE(target_path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        tmp_path.replace(target_path)
+    except BaseException:
+        # 書き込みに失敗した一時ファイルを残さない
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    dir_fd = os.open(target_path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _save_raw_target(data: dict[str, Any], *, create_backup: bool = True, backup_count: int = 10) -> str:
     """target.yaml を保存（アトミック書き込み）.
 
     Args:
         data: 保存するデータ
         create_backup: バックアップを作成するか
+        backup_count: 保持するバックアップ数（古いものから削除）
+
+    Returns:
+        保存した YAML 文字列
     """
     target_path = _get_target_file_path()
+    content = _dump_yaml(data)
+    encoded = content.encode("utf-8")
+
+    # 内容が変わらない場合（変更せずに保存した場合など）はバックアップ作成と書き込みを省略
+    try:
+        if target_path.read_bytes() == encoded:
+            logging.info("target.yaml is unchanged, skipped writing")
+            return content
+    except FileNotFoundError:
+        pass
 
     # バックアップ作成
     if create_backup and target_path.exists():
         timestamp = my_lib.time.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = target_path.with_suffix(f".yaml.bak.{timestamp}")
-        shutil.copy2(target_path, backup_path)
+        backup_path = target_path.with_name(_backup_name(target_path, timestamp))
+        # 直後に一時ファイルで置き換えるため、現在のファイルはハードリンクで残せば内容をコピーせずに済む
+        # （ハードリンクに対応していないファイルシステムやデバイスをまたぐ場合はコピー）
+        try:
+            os.link(target_path, backup_path)
+        except OSError:
+            shutil.copy2(target_path, backup_path)
         logging.info("Created backup: %s", backup_path)
+        _remove_old_backups(target_path, backup_count)
 
-    # 一時ファイルに書き込み
-    tmp_path = target_path.with_suffix(".yaml.tmp")
-    with tmp_path.open("w", encoding="utf-8") as f:
-        _yaml.dump(data, f)
-
-    # アトミックに置換
-    tmp_path.replace(target_path)
+    _write_file_atomic(target_path, encoded)
+    if _schema_cache is not None:
+        _schema_cache.invalidate()
     logging.info("Saved target.yaml")
+    return content
+
+
+# target.yaml で省略された場合のデフォルト値
+# 読み込み時の補完と保存時の省略の両方で同じ値を参照する
+_DEFAULT_CHECK_METHOD = "scrape"
+_DEFAULT_PRICE_UNIT = "円"
+_DEFAULT_ACTION_TYPE = "click"
+
+# 生データに出力するフィールドと値の取得方法（値が空・デフォルト値の場合は出力しない）
+# NOTE: 保存する YAML のキー順はこの定義順になる
+_StoreDef = price_watch.webapi.schemas.StoreDefinitionSchema
+_StoreEntry = price_watch.webapi.schemas.StoreEntrySchema
+
+_STORE_FIELDS: tuple[tuple[str, Callable[[_StoreDef], Any]], ...] = (
+    # check_method (scrape 以外のみ出力)
+    ("check_method", lambda s: s.check_method if s.check_method != _DEFAULT_CHECK_METHOD else None),
+    # XPath 関連
+    ("price_xpath", operator.attrgetter("price_xpath")),
+    ("thumb_img_xpath", operator.attrgetter("thumb_img_xpath")),
+    ("unavailable_xpath", operator.attrgetter("unavailable_xpath")),
+    # 通貨・ポイント
+    ("price_unit", lambda s: s.price_unit if s.price_unit != _DEFAULT_PRICE_UNIT else None),
+    ("point_rate", lambda s: s.point_rate if s.point_rate > 0 else None),
+    # 色
+    ("color", operator.attrgetter("color")),
+    # アフィリエイトID
+    ("affiliate_id", operator.attrgetter("affiliate_id")),
+    # アクション
+    (
+        "action",
+        lambda s: [
+            {k: v for k, v in {"type": a.type, "xpath": a.xpath, "value": a.value}.items() if v}
+            for a in s.action
+        ],
+    ),
+)
+
+_STORE_ENTRY_FIELDS: tuple[tuple[str, Callable[[_StoreEntry], Any]], ...] = (
+    ("url", operator.attrgetter("url")),
+    ("asin", operator.attrgetter("asin")),
+    ("price_xpath", operator.attrgetter("price_xpath")),
+    ("thumb_img_xpath", operator.attrgetter("thumb_img_xpath")),
+    ("unavailable_xpath", operator.attrgetter("unavailable_xpath")),
+    ("price_unit", operator.attrgetter("price_unit")),
+    ("preload", lambda e: {"url": e.preload.url, "every": e.preload.every} if e.preload else None),
+    ("search_keyword", operator.attrgetter("search_keyword")),
+    ("exclude_keyword", operator.attrgetter("exclude_keyword")),
+    ("price", lambda e: list(e.price) if e.price else None),
+    ("cond", operator.attrgetter("cond")),
+    ("jan_code", operator.attrgetter("jan_code")),
+)
 
 
 def _convert_schema_to_raw(config: price_watch.webapi.schemas.TargetConfigSchema) -> dict[str, Any]:
@@ -95,46 +283,10 @@ def _convert_schema_to_raw(config: price_watch.webapi.schemas.TargetConfigSchema
 
     # store_list
     if config.store_list:
-        store_list = []
-        for store in config.store_list:
-            store_data: dict[str, Any] = {"name": store.name}
-
-            # check_method (scrape 以外のみ出力)
-            if store.check_method != "scrape":
-                store_data["check_method"] = store.check_method
-
-            # XPath 関連
-            if store.price_xpath:
-                store_data["price_xpath"] = store.price_xpath
-            if store.thumb_img_xpath:
-                store_data["thumb_img_xpath"] = store.thumb_img_xpath
-            if store.unavailable_xpath:
-                store_data["unavailable_xpath"] = store.unavailable_xpath
-
-            # 通貨・ポイント
-            if store.price_unit != "円":
-                store_data["price_unit"] = store.price_unit
-            if store.point_rate > 0:
-                store_data["point_rate"] = store.point_rate
-
-            # 色
-            if store.color:
-                store_data["color"] = store.color
-
-            # アフィリエイトID
-            if store.affiliate_id:
-                store_data["affiliate_id"] = store.affiliate_id
-
-            # アクション
-            if store.action:
-                store_data["action"] = [
-                    {k: v for k, v in {"type": a.type, "xpath": a.xpath, "value": a.value}.items() if v}
-                    for a in store.action
-                ]
-
-            store_list.append(store_data)
-
-        result["store_list"] = store_list
+        result["store_list"] = [
+            {"name": store.name, **{key: value for key, getter in _STORE_FIELDS if (value := getter(store))}}
+            for store in config.store_list
+        ]
 
     # item_list
     if config.item_list:
@@ -153,41 +305,13 @@ def _convert_schema_to_raw(config: price_watch.webapi.schemas.TargetConfigSchema
                 item_data["cond"] = item.cond
 
             # ストアリスト
-            store_entries = []
-            for store_entry in item.store:
-                entry_data: dict[str, Any] = {"name": store_entry.name}
-
-                if store_entry.url:
-                    entry_data["url"] = store_entry.url
-                if store_entry.asin:
-                    entry_data["asin"] = store_entry.asin
-                if store_entry.price_xpath:
-                    entry_data["price_xpath"] = store_entry.price_xpath
-                if store_entry.thumb_img_xpath:
-                    entry_data["thumb_img_xpath"] = store_entry.thumb_img_xpath
-                if store_entry.unavailable_xpath:
-                    entry_data["unavailable_xpath"] = store_entry.unavailable_xpath
-                if store_entry.price_unit:
-                    entry_data["price_unit"] = store_entry.price_unit
-                if store_entry.preload:
-                    entry_data["preload"] = {
-                        "url": store_entry.preload.url,
-                        "every": store_entry.preload.every,
-                    }
-                if store_entry.search_keyword:
-                    entry_data["search_keyword"] = store_entry.search_keyword
-                if store_entry.exclude_keyword:
-                    entry_data["exclude_keyword"] = store_entry.exclude_keyword
-                if store_entry.price:
-                    entry_data["price"] = list(store_entry.price)
-                if store_entry.cond:
-                    entry_data["cond"] = store_entry.cond
-                if store_entry.jan_code:
-                    entry_data["jan_code"] = store_entry.jan_code
-
-                store_entries.append(entry_data)
-
-            item_data["store"] = store_entries
+            item_data["store"] = [
+                {
+                    "name": entry.name,
+                    **{key: value for key, getter in _STORE_ENTRY_FIELDS if (value := getter(entry))},
+                }
+                for entry in item.store
+            ]
             item_list.append(item_data)
 
         result["item_list"] = item_list
@@ -195,19 +319,70 @@ def _convert_schema_to_raw(config: price_watch.webapi.schemas.TargetConfigSchema
     return result
 
 
+def _coerce_price_list(price_data: Any) -> list[int] | None:
+    """price フィールド（単一の値またはリスト）を価格のリストに変換."""
+    if isinstance(price_data, list):
+        return [int(p) for p in price_data]
+    if isinstance(price_data, int):
+        return [price_data]
+    return None
+
+
+def _as_str(value: Any) -> str | None:
+    """文字列型のフィールドの値を文字列に揃える（YAML で数値として読み込まれた JAN コード等）."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _convert_raw_store_entry(
+    name: str, entry_data: dict[str, Any]
+) -> price_watch.webapi.schemas.StoreEntrySchema:
+    """生データのストアエントリ（旧書式ではアイテム定義）をスキーマに変換."""
+    get = entry_data.get
+
+    preload = None
+    preload_data = get("preload")
+    if preload_data is not None:
+        preload = price_watch.webapi.schemas.PreloadConfigSchema.model_construct(
+            url=_as_str(preload_data["url"]),
+            every=int(preload_data.get("every", 1)),
+        )
+
+    return price_watch.webapi.schemas.StoreEntrySchema.model_construct(
+        name=_as_str(name),
+        url=_as_str(get("url")),
+        asin=_as_str(get("asin")),
+        price_xpath=_as_str(get("price_xpath")),
+        thumb_img_xpath=_as_str(get("thumb_img_xpath")),
+        unavailable_xpath=_as_str(get("unavailable_xpath")),
+        price_unit=_as_str(get("price_unit")),
+        preload=preload,
+        search_keyword=_as_str(get("search_keyword")),
+        exclude_keyword=_as_str(get("exclude_keyword")),
+        price=_coerce_price_list(get("price")),
+        cond=_as_str(get("cond")),
+        jan_code=_as_str(get("jan_code")),
+    )
+
+
 def _convert_raw_to_schema(data: dict[str, Any]) -> price_watch.webapi.schemas.TargetConfigSchema:
-    """生データから Pydantic スキーマに変換."""
+    """生データから Pydantic スキーマに変換.
+
+    target.yaml はクローラー等の読み込み時に JSON スキーマで検証されるサーバー側のファイルで、
+    数値・文字列の型の変換もここで行っているため、model_construct でバリデーションを省略して構築します。
+    """
     # category_list
-    category_list = data.get("category_list", [])
+    category_list = [str(category) for category in data.get("category_list", [])]
 
     # store_list
     store_list = []
     for store_data in data.get("store_list", []):
         actions = [
-            price_watch.webapi.schemas.ActionStepSchema(
-                type=action.get("type", "click"),
-                xpath=action.get("xpath"),
-                value=action.get("value"),
+            price_watch.webapi.schemas.ActionStepSchema.model_construct(
+                type=_as_str(action.get("type", _DEFAULT_ACTION_TYPE)),
+                xpath=_as_str(action.get("xpath")),
+                value=_as_str(action.get("value")),
             )
             for action in store_data.get("action", [])
         ]
@@ -217,117 +392,47 @@ def _convert_raw_to_schema(data: dict[str, Any]) -> price_watch.webapi.schemas.T
         point_rate = float(assumption.get("point_rate", store_data.get("point_rate", 0.0)))
 
         store_list.append(
-            price_watch.webapi.schemas.StoreDefinitionSchema(
-                name=store_data["name"],
-                check_method=store_data.get("check_method", "scrape"),
-                price_xpath=store_data.get("price_xpath"),
-                thumb_img_xpath=store_data.get("thumb_img_xpath"),
-                unavailable_xpath=store_data.get("unavailable_xpath"),
-                price_unit=store_data.get("price_unit", "円"),
+            price_watch.webapi.schemas.StoreDefinitionSchema.model_construct(
+                name=_as_str(store_data["name"]),
+                check_method=_as_str(store_data.get("check_method", _DEFAULT_CHECK_METHOD)),
+                price_xpath=_as_str(store_data.get("price_xpath")),
+                thumb_img_xpath=_as_str(store_data.get("thumb_img_xpath")),
+                unavailable_xpath=_as_str(store_data.get("unavailable_xpath")),
+                price_unit=_as_str(store_data.get("price_unit", _DEFAULT_PRICE_UNIT)),
                 point_rate=point_rate,
-                color=store_data.get("color"),
+                color=_as_str(store_data.get("color")),
                 action=actions,
-                affiliate_id=store_data.get("affiliate_id"),
+                affiliate_id=_as_str(store_data.get("affiliate_id")),
             )
         )
 
     # item_list
     item_list = []
     for item_data in data.get("item_list", []):
-        store_entries = []
+        store_entries: list[price_watch.webapi.schemas.StoreEntrySchema] = []
         store_field = item_data.get("store", [])
 
         # 新書式: store がリスト
         if isinstance(store_field, list):
-            for store_entry in store_field:
-                preload = None
-                if "preload" in store_entry:
-                    preload = price_watch.webapi.schemas.PreloadConfigSchema(
-                        url=store_entry["preload"]["url"],
-                        every=store_entry["preload"].get("every", 1),
-                    )
-
-                # price フィールドの処理
-                price = None
-                if "price" in store_entry:
-                    price_data = store_entry["price"]
-                    if isinstance(price_data, list):
-                        price = [int(p) for p in price_data]
-                    elif isinstance(price_data, int):
-                        price = [price_data]
-
-                store_entries.append(
-                    price_watch.webapi.schemas.StoreEntrySchema(
-                        name=store_entry["name"],
-                        url=store_entry.get("url"),
-                        asin=store_entry.get("asin"),
-                        price_xpath=store_entry.get("price_xpath"),
-                        thumb_img_xpath=store_entry.get("thumb_img_xpath"),
-                        unavailable_xpath=store_entry.get("unavailable_xpath"),
-                        price_unit=store_entry.get("price_unit"),
-                        preload=preload,
-                        search_keyword=store_entry.get("search_keyword"),
-                        exclude_keyword=store_entry.get("exclude_keyword"),
-                        price=price,
-                        cond=store_entry.get("cond"),
-                        jan_code=store_entry.get("jan_code"),
-                    )
-                )
+            store_entries = [_convert_raw_store_entry(entry["name"], entry) for entry in store_field]
         # 旧書式: store が文字列（単一ストア）
         elif isinstance(store_field, str):
-            preload = None
-            if "preload" in item_data:
-                preload = price_watch.webapi.schemas.PreloadConfigSchema(
-                    url=item_data["preload"]["url"],
-                    every=item_data["preload"].get("every", 1),
-                )
-
-            price = None
-            if "price" in item_data:
-                price_data = item_data["price"]
-                if isinstance(price_data, list):
-                    price = [int(p) for p in price_data]
-                elif isinstance(price_data, int):
-                    price = [price_data]
-
-            store_entries.append(
-                price_watch.webapi.schemas.StoreEntrySchema(
-                    name=store_field,
-                    url=item_data.get("url"),
-                    asin=item_data.get("asin"),
-                    price_xpath=item_data.get("price_xpath"),
-                    thumb_img_xpath=item_data.get("thumb_img_xpath"),
-                    unavailable_xpath=item_data.get("unavailable_xpath"),
-                    price_unit=item_data.get("price_unit"),
-                    preload=preload,
-                    search_keyword=item_data.get("search_keyword"),
-                    exclude_keyword=item_data.get("exclude_keyword"),
-                    price=price,
-                    cond=item_data.get("cond"),
-                    jan_code=item_data.get("jan_code"),
-                )
-            )
+            store_entries = [_convert_raw_store_entry(store_field, item_data)]
 
-        # アイテムレベルの price と cond
-        item_price = None
-        if "price" in item_data and isinstance(item_data.get("store"), list):
-            price_data = item_data["price"]
-            if isinstance(price_data, list):
-                item_price = [int(p) for p in price_data]
-            elif isinstance(price_data, int):
-                item_price = [price_data]
+        # アイテムレベルの price と cond（旧書式ではストアエントリ側に含める）
+        is_new_format = isinstance(item_data.get("store"), list)
 
         item_list.append(
-            price_watch.webapi.schemas.ItemDefinitionSchema(
-                name=item_data["name"],
-                category=item_data.get("category"),
-                price=item_price,
-                cond=item_data.get("cond") if isinstance(item_data.get("store"), list) else None,
+            price_watch.webapi.schemas.ItemDefinitionSchema.model_construct(
+                name=_as_str(item_data["name"]),
+                category=_as_str(item_data.get("category")),
+                price=_coerce_price_list(item_data.get("price")) if is_new_format else None,
+                cond=_as_str(item_data.get("cond")) if is_new_format else None,
                 store=store_entries,
             )
         )
 
-    return price_watch.webapi.schemas.TargetConfigSchema(
+    return price_watch.webapi.schemas.TargetConfigSchema.model_construct(
         category_list=category_list,
         store_list=store_list,
         item_list=item_list,
@@ -341,23 +446,25 @@ def _validate_config(
     errors: list[price_watch.webapi.schemas.ValidationError] = []
 
     # ストア名の重複チェック
-    store_names = [s.name for s in config.store_list]
-    seen: set[str] = set()
-    for i, name in enumerate(store_names):
-        if name in seen:
+    # あわせてアイテムのストア参照チェックで使う ストア名 → ストア定義 の辞書を構築する
+    # （重複時は先頭の定義を優先）
+    store_defs: dict[str, price_watch.webapi.schemas.StoreDefinitionSchema] = {}
+    for i, store_def in enumerate(config.store_list):
+        if store_def.name in store_defs:
             errors.append(
                 price_watch.webapi.schemas.ValidationError(
                     path=f"store_list[{i}].name",
-                    message=f"ストア名 '{name}' が重複しています",
+                    message=f"ストア名 '{store_def.name}' が重複しています",
                 )
             )
-        seen.add(name)
+        else:
+            store_defs[store_def.name] = store_def
 
     # アイテムのストア参照チェック
-    valid_stores = set(store_names)
     for i, item in enumerate(config.item_list):
         for j, store_entry in enumerate(item.store):
-            if store_entry.name not in valid_stores:
+            store_def = store_defs.get(store_entry.name)
+            if store_def is None:
                 errors.append(
                     price_watch.webapi.schemas.ValidationError(
                         path=f"item_list[{i}].store[{j}].name",
@@ -366,10 +473,9 @@ def _validate_config(
                 )
 
             # check_method に応じた必須フィールドチェック
-            store_def = next((s for s in config.store_list if s.name == store_entry.name), None)
             if store_def:
                 required_fields = price_watch.webapi.schemas.CHECK_METHOD_REQUIRED_FIELDS.get(
-                    store_def.check_method, []
+                    store_def.check_method, ()
                 )
 
                 for field in required_fields:
@@ -432,39 +538,72 @@ def _validate_config(
     return errors
 
 
+# GET /api/target のレスポンス JSON（スキーマのキャッシュが更新されるまで使い回す）
+_target_response_cache: tuple[price_watch.webapi.schemas.TargetConfigSchema, bool, str] | None = None
+
+
+def _get_target_response_json(
+    config: price_watch.webapi.schemas.TargetConfigSchema, require_password: bool
+) -> str:
+    """GET /api/target のレスポンス JSON を取得（同じスキーマに対しては直列化を省略）."""
+    global _target_response_cache
+    cached = _target_response_cache
+    if cached is not None and cached[0] is config and cached[1] == require_password:
+        return cached[2]
+
+    response = price_watch.webapi.schemas.TargetConfigResponse.model_construct(
+        config=config,
+        check_methods=list(price_watch.webapi.schemas.CHECK_METHODS),
+        action_types=list(price_watch.webapi.schemas.ACTION_TYPES),
+        require_password=require_password,
+    )
+    body = response.model_dump_json()
+    _target_response_cache = (config, require_password, body)
+    return body
+
+
 @blueprint.route("/api/target", methods=["GET"])
 def get_target() -> flask.Response | tuple[flask.Response, int]:
     """target.yaml の現在の設定を取得."""
     try:
-        raw_data = _load_raw_target()
-        config = _convert_raw_to_schema(raw_data)
+        config = _load_target_schema()
 
         # パスワード認証が必要かどうかを判定
         # edit.password_hash は必須のため、app_config があれば常に True
         app_config = price_watch.webapi.cache.get_app_config()
         require_password = app_config is not None
 
-        response = price_watch.webapi.schemas.TargetConfigResponse(
-            config=config,
-            check_methods=price_watch.webapi.schemas.CHECK_METHODS,
-            action_types=price_watch.webapi.schemas.ACTION_TYPES,
-            require_password=require_password,
+        return flask.Response(
+            _get_target_response_json(config, require_password), mimetype="application/json"
         )
 
-        return flask.jsonify(response.model_dump())
-
     except Exception:
         logging.exception("Error getting target config")
         error = price_watch.webapi.schemas.ErrorResponse(error="設定の読み込みに失敗しました")
         return flask.jsonify(error.model_dump()), 500
 
 
+_BodyT = TypeVar("_BodyT", bound=pydantic.BaseModel)
+
+
+def _parse_body(model: type[_BodyT]) -> _BodyT:
+    """リクエストボディを JSON バイト列から直接検証.
+
+    中間の dict を構築せず pydantic-core で JSON をそのまま検証します。
+    不正な値の場合は flask-pydantic と同じ形式の 400 レスポンスで中断します。
+    """
+    try:
+        return model.model_validate_json(flask.request.get_data(cache=False))
+    except pydantic.ValidationError as e:
+        # NOTE: JSON として不正な場合の input は生のバイト列で JSON にシリアライズできないため含めない
+        errors = e.errors(include_url=False, include_context=False, include_input=False)
+        flask.abort(flask.make_response(flask.jsonify({"validation_error": {"body_params": errors}}), 400))
+
+
 @blueprint.route("/api/target", methods=["PUT"])
-@validate()
-def update_target(
-    body: price_watch.webapi.schemas.TargetUpdateRequest,
-) -> flask.Response | tuple[flask.Response, int]:
+def update_target() -> flask.Response | tuple[flask.Response, int]:
     """target.yaml を更新."""
+    body = _parse_body(price_watch.webapi.schemas.TargetUpdateRequest)
     try:
         # アプリ設定を取得（必須）
         app_config = price_watch.webapi.cache.get_app_config()
@@ -516,17 +655,14 @@ def update_target(
 
         # 保存
         raw_data = _convert_schema_to_raw(body.config)
-        _save_raw_target(raw_data, create_backup=body.create_backup)
+        content = _save_raw_target(
+            raw_data, create_backup=body.create_backup, backup_count=app_config.edit.backup_count
+        )
 
         # Git push（設定されている場合）
         git_pushed = False
         git_commit_url: str | None = None
         if app_config and app_config.edit.git:
-            # YAML 文字列を生成
-            yaml_output = io.StringIO()
-            _yaml.dump(raw_data, yaml_output)
-            content = yaml_output.getvalue()
-
             # コミットメッセージを生成（ファイル名を含める）
             target_file_name = _get_target_file_path().name
             commit_message = f"fix: {target_file_name} via price-watch Web UI"
@@ -550,7 +686,7 @@ def update_target(
             git_pushed=git_pushed,
             git_commit_url=git_commit_url,
         )
-        return flask.jsonify(update_response.model_dump())
+        return price_watch.webapi.json_provider.schema_response(update_response)
 
     except Exception:
         logging.exception("Error updating target config")
@@ -559,11 +695,9 @@ def update_target(
 
 
 @blueprint.route("/api/target/validate", methods=["POST"])
-@validate()
-def validate_target(
-    body: price_watch.webapi.schemas.TargetConfigSchema,
-) -> flask.Response:
+def validate_target() -> flask.Response:
     """設定の事前バリデーション（保存せずに検証）."""
+    body = _parse_body(price_watch.webapi.schemas.TargetConfigSchema)
     errors = _validate_config(body)
     response = price_watch.webapi.schemas.ValidateResponse(valid=len(errors) == 0, errors=errors)
-    return flask.jsonify(response.model_dump())
+    return price_watch.webapi.json_provider.schema_response(response)
@@ -8,16 +8,20 @@ import logging
 import threading
 
 import flask
-import my_lib.store.yodobashi
-import selenium.webdriver.support.wait
 from pydantic import BaseModel, Field
 
 import price_watch.webapi.cache
+import price_watch.webapi.json_provider
 
 blueprint = flask.Blueprint("yodobashi_search", __name__)
 
 # 検索時の排他制御用ロック
+# NOTE: WebDriver は固定プロファイルを使う 1 インスタンスのみのため、検索は直列に処理する
 _search_lock = threading.Lock()
+# 先行する検索の完了を待つ最大秒数（これを超えた場合は 503 を返す）
+_SEARCH_WAIT_SEC = 20
+# 503 応答時にクライアントへ通知する再試行までの秒数
+_RETRY_AFTER_SEC = 5
 
 
 class YodobashiSearchRequest(BaseModel):
@@ -67,6 +71,10 @@ def check_available() -> flask.Response:
 @blueprint.route("/api/yodobashi/search", methods=["POST"])
 def search() -> flask.Response | tuple[flask.Response, int]:
     """ヨドバシ商品をキーワードで検索."""
+    # NOTE: Selenium 関連は検索時にのみ必要なため、サーバー起動時には読み込まない
+    import my_lib.store.yodobashi
+    import selenium.webdriver.support.wait
+
     # リクエストのバリデーション
     try:
         data = flask.request.get_json()
@@ -81,9 +89,13 @@ def search() -> flask.Response | tuple[flask.Response, int]:
         return flask.jsonify(error.model_dump()), 400
 
     # 排他制御: 同時に1リクエストのみ処理
-    if not _search_lock.acquire(blocking=False):
+    # 連続した検索が即座に失敗しないよう、先行する検索の完了を一定時間待つ
+    if not _search_lock.acquire(timeout=_SEARCH_WAIT_SEC):
+        logging.warning("ヨドバシ検索の待機がタイムアウトしました: keywords=%s", request.keywords)
         error = ErrorResponse(error="他の検索リクエストを処理中です。しばらくしてから再試行してください。")
-        return flask.jsonify(error.model_dump()), 503
+        busy_response = flask.jsonify(error.model_dump())
+        busy_response.headers["Retry-After"] = str(_RETRY_AFTER_SEC)
+        return busy_response, 503
 
     try:
         # WebDriver を取得
@@ -104,8 +116,9 @@ def search() -> flask.Response | tuple[flask.Response, int]:
                 max_items=request.item_count,
             )
 
+            # 検索結果は my_lib 側で型付けされた値のため、バリデーションを省略して構築する
             items = [
-                YodobashiSearchResultItem(
+                YodobashiSearchResultItem.model_construct(
                     name=item.name,
                     url=item.url,
                     price=item.price,
@@ -114,8 +127,8 @@ def search() -> flask.Response | tuple[flask.Response, int]:
                 for item in results
             ]
 
-            response = YodobashiSearchResponse(items=items)
-            return flask.jsonify(response.model_dump())
+            response = YodobashiSearchResponse.model_construct(items=items)
+            return price_watch.webapi.json_provider.schema_response(response)
 
         except Exception:
             logging.exception("ヨドバシ検索エラー: keywords=%s", request.keywords)
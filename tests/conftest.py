@@ -7,14 +7,21 @@
 """
 
 import logging
+import os
 import pathlib
+import shutil
+import tempfile
+import types
 import unittest.mock
+from collections.abc import Iterator
+from typing import Any
 
 import flask
 import flask.testing
 import my_lib.pytest_util
 import pytest
 
+import price_watch.const
 import price_watch.managers.history
 import price_watch.webapi.server
 
@@ -58,24 +65,52 @@ def _clear():
     """各テスト前にステートをクリア"""
     import my_lib.notify.slack
 
+    import price_watch.webapi.cache
+
     my_lib.notify.slack._interval_clear()
     my_lib.notify.slack._hist_clear()
+    price_watch.webapi.cache.clear_history_response_cache()
 
 
 # === データベースフィクスチャ ===
+# RAM ディスク（利用可能な場合はテスト用 DB を配置して fsync の待ち時間を避ける）
+_SHM_DIR = pathlib.Path("/dev/shm")  # noqa: S108
+
+
 @pytest.fixture
-def temp_data_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+def temp_data_dir(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
     """一時データディレクトリを作成（ワーカー固有）"""
+    if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK):
+        # mkdtemp でテストごとに一意なディレクトリを作成するため、ワーカー間で衝突しない
+        data_dir = pathlib.Path(tempfile.mkdtemp(prefix="price-watch-test-", dir=_SHM_DIR))
+        yield data_dir
+        shutil.rmtree(data_dir, ignore_errors=True)
+        return
+
     # pytest-xdist 並列実行時はワーカーIDをディレクトリ名に付加
     data_dir = my_lib.pytest_util.get_path(tmp_path / "data")
     data_dir.mkdir(parents=True, exist_ok=True)
-    return data_dir
+    yield data_dir
+
+
+@pytest.fixture(scope="session")
+def history_db_template(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """スキーマ作成済みの空の履歴 DB ファイルを作成（セッションで 1 回）"""
+    data_dir = tmp_path_factory.mktemp("history_template")
+    price_watch.managers.history.HistoryManager.create(data_dir).initialize()
+    return data_dir / price_watch.const.DB_FILE
 
 
 @pytest.fixture
-def history_manager(temp_data_dir: pathlib.Path) -> price_watch.managers.history.HistoryManager:
-    """初期化済みの HistoryManager を作成"""
+def history_manager(
+    temp_data_dir: pathlib.Path, history_db_template: pathlib.Path
+) -> price_watch.managers.history.HistoryManager:
+    """初期化済みの HistoryManager を作成
+
+    テストごとにスキーマを作成する代わりに、作成済みの DB ファイルをコピーして使用する。
+    """
     manager = price_watch.managers.history.HistoryManager.create(temp_data_dir)
+    shutil.copyfile(history_db_template, manager.db.db_path)
     manager.initialize()
     return manager
 
@@ -89,14 +124,15 @@ def initialized_db(
 
 
 # === Web API フィクスチャ ===
-@pytest.fixture
-def app(
-    history_manager: price_watch.managers.history.HistoryManager,
-    tmp_path: pathlib.Path,
-) -> flask.Flask:
-    """Flask アプリケーションフィクスチャ"""
+@pytest.fixture(scope="session")
+def app(tmp_path_factory: pytest.TempPathFactory) -> flask.Flask:
+    """Flask アプリケーションフィクスチャ
+
+    アプリケーションはセッションで 1 回だけ構築する。
+    テストごとの HistoryManager は webapi.cache.get_history_manager のモックで差し替える。
+    """
     # テスト用のダミー静的ディレクトリ（存在しないパスでも可）
-    static_dir = tmp_path / "static"
+    static_dir = tmp_path_factory.mktemp("webapp") / "static"
 
     # get_app_config をモック
     mock_config = unittest.mock.MagicMock()
@@ -108,8 +144,6 @@ def app(
     ):
         app = price_watch.webapi.server.create_app(static_dir_path=static_dir)
 
-    # テスト用の HistoryManager をアプリケーションコンテキストに保存
-    app.config["history_manager"] = history_manager
     return app
 
 
@@ -120,31 +154,35 @@ def client(app: flask.Flask) -> flask.testing.FlaskClient:
 
 
 # === テストデータフィクスチャ ===
-@pytest.fixture
-def sample_item() -> dict:
+@pytest.fixture(scope="session")
+def sample_item() -> types.MappingProxyType[str, Any]:
     """サンプルアイテムデータ
 
     Note: stock は 0（在庫なし）または 1（在庫あり）のブール値的な値。
     history.insert の時間単位重複排除ロジックは stock=1 の場合のみ
     最安値を保持する。
+    セッション内で共有するため読み取り専用。値を変更する場合は .copy() した dict を使用すること。
     """
-    return {
-        "name": "テスト商品",
-        "url": "https://example.com/item/1",
-        "store": "test-store.com",
-        "price": 1000,
-        "stock": 1,
-        "thumb_url": None,
-    }
+    return types.MappingProxyType(
+        {
+            "name": "テスト商品",
+            "url": "https://example.com/item/1",
+            "store": "test-store.com",
+            "price": 1000,
+            "stock": 1,
+            "thumb_url": None,
+        }
+    )
 
 
-@pytest.fixture
-def sample_items() -> list[dict]:
+@pytest.fixture(scope="session")
+def sample_items() -> tuple[types.MappingProxyType[str, Any], ...]:
     """複数のサンプルアイテムデータ
 
     Note: stock は 0（在庫なし）または 1（在庫あり）のブール値的な値。
+    セッション内で共有するため読み取り専用。値を変更する場合は .copy() した dict を使用すること。
     """
-    return [
+    items = [
         {
             "name": "商品A",
             "url": "https://store1.com/item/1",
@@ -170,24 +208,30 @@ def sample_items() -> list[dict]:
             "thumb_url": None,
         },
     ]
+    return tuple(types.MappingProxyType(item) for item in items)
 
 
 # === Slack 通知検証 ===
-@pytest.fixture
-def slack_checker():
-    """Slack 通知検証ヘルパーを返す"""
-    import my_lib.notify.slack
+class SlackChecker:
+    """Slack 通知検証ヘルパー（状態を持たないためセッションで共有する）"""
+
+    def assert_notified(self, message: str, index: int = -1) -> None:
+        import my_lib.notify.slack
+
+        notify_hist = my_lib.notify.slack._hist_get(is_thread_local=False)
+        assert notify_hist, "通知がされていません。"
+        assert notify_hist[index].find(message) != -1, f"「{message}」が通知されていません。"
 
-    class SlackChecker:
-        def assert_notified(self, message: str, index: int = -1) -> None:
-            notify_hist = my_lib.notify.slack._hist_get(is_thread_local=False)
-            assert notify_hist, "通知がされていません。"
-            assert notify_hist[index].find(message) != -1, f"「{message}」が通知されていません。"
+    def assert_not_notified(self) -> None:
+        import my_lib.notify.slack
 
-        def assert_not_notified(self) -> None:
-            notify_hist = my_lib.notify.slack._hist_get(is_thread_local=False)
-            assert notify_hist == [], "通知がされています。"
+        notify_hist = my_lib.notify.slack._hist_get(is_thread_local=False)
+        assert notify_hist == [], "通知がされています。"
 
+
+@pytest.fixture(scope="session")
+def slack_checker() -> SlackChecker:
+    """Slack 通知検証ヘルパーを返す"""
     return SlackChecker()
 
 
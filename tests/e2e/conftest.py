@@ -32,18 +32,29 @@ def pytest_addoption(parser):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def host(request):
     """E2E テスト対象のホストを返す"""
     return request.config.getoption("--host")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def port(request):
     """E2E テスト対象のポートを返す"""
     return request.config.getoption("--port")
 
 
+@pytest.fixture(scope="session")
+def api_request(playwright, host, port):
+    """API テスト用のリクエストコンテキストを返す
+
+    API のみを検証するテストではブラウザコンテキストやページを作成せずにリクエストを送る。
+    """
+    context = playwright.request.new_context(base_url=f"http://{host}:{port}")
+    yield context
+    context.dispose()
+
+
 @pytest.fixture
 def page(page):
     """Playwright ページにデフォルトタイムアウトを設定"""
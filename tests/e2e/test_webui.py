@@ -7,6 +7,7 @@ Playwright を使用して WebUI の E2E テストを実行します。
 """
 
 import logging
+import os
 import pathlib
 
 import pytest
@@ -14,22 +15,37 @@ from playwright.sync_api import expect
 
 # プロジェクトルートの reports/evidence/ に保存
 EVIDENCE_DIR = pathlib.Path(__file__).parent.parent.parent / "reports" / "evidence"
+# 環境変数 EVIDENCE_FULL_PAGE=true でページ全体のスクリーンショットを保存（未指定時は表示領域のみ）
+EVIDENCE_FULL_PAGE = os.environ.get("EVIDENCE_FULL_PAGE", "").lower() == "true"
 
 # URL プレフィックス
 URL_PREFIX = "/price"
 PRICE_URL_TMPL = "http://{host}:{port}" + URL_PREFIX
 
+# 複数のテストで使用するセレクタ
+# 期間セレクタの「30日」ボタン（一覧ページの表示確認に使用）
+SEL_PERIOD_30D = "button:has-text('30日')"
+# アイテムカード（ItemCard.tsx のクラス: bg-white rounded-lg shadow-md）
+SEL_ITEM_CARD = "div.bg-white.rounded-lg.shadow-md"
 
-def price_url(host, port):
-    """価格履歴ページの URL を生成"""
+
+@pytest.fixture(scope="session")
+def price_page_url(host, port):
+    """価格履歴ページの URL を返す"""
     return PRICE_URL_TMPL.format(host=host, port=port)
 
 
+@pytest.fixture(scope="class")
+def items_api_response(api_request):
+    """アイテム一覧 API のレスポンスを返す（クラス内のテストで共有）"""
+    return api_request.get(f"{URL_PREFIX}/api/items")
+
+
 @pytest.mark.e2e
 class TestWebuiE2E:
     """WebUI E2E テスト"""
 
-    def test_price_page_loads(self, page, host, port):
+    def test_price_page_loads(self, page, price_page_url):
         """価格履歴ページ表示の E2E テスト
 
         1. 価格履歴ページにアクセス
@@ -47,17 +63,16 @@ class TestWebuiE2E:
         )
 
         # 価格履歴ページにアクセス
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # ページタイトルを確認
         expect(page).to_have_title("Price Watch")
 
         # スクリーンショットを保存
         screenshot_path = EVIDENCE_DIR / "e2e_price_page.png"
-        screenshot_path.parent.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(screenshot_path), full_page=True)
+        page.screenshot(path=str(screenshot_path), full_page=EVIDENCE_FULL_PAGE)
 
-    def test_price_page_charts(self, page, host, port):
+    def test_price_page_charts(self, page, price_page_url):
         """価格履歴ページのチャート表示テスト
 
         1. 価格履歴ページにアクセス
@@ -65,7 +80,7 @@ class TestWebuiE2E:
         """
         page.set_viewport_size({"width": 1920, "height": 1080})
 
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # Chart.js のキャンバス要素が存在することを確認
         canvas_elements = page.locator("canvas")
@@ -73,7 +88,7 @@ class TestWebuiE2E:
         # チャートが1つ以上存在（ローディング完了まで待機）
         expect(canvas_elements.first).to_be_visible(timeout=30000)
 
-    def test_price_page_period_selector(self, page, host, port):
+    def test_price_page_period_selector(self, page, price_page_url):
         """期間セレクタのテスト
 
         1. 価格履歴ページにアクセス
@@ -81,35 +96,33 @@ class TestWebuiE2E:
         """
         page.set_viewport_size({"width": 1920, "height": 1080})
 
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # 期間セレクタのボタンが存在することを確認
-        period_button = page.locator("button:has-text('30日')")
+        period_button = page.locator(SEL_PERIOD_30D)
         expect(period_button).to_be_visible(timeout=10000)
 
-    def test_api_items(self, page, host, port):
+    def test_api_items(self, items_api_response):
         """アイテム一覧 API のテスト"""
-        response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items")
+        response = items_api_response
 
         # エラー時はレスポンスボディを表示（デバッグ用）
         assert response.ok, f"API error: {response.status} - {response.text()}"
         data = response.json()
         assert "items" in data
 
-    def test_api_items_with_days(self, page, host, port):
+    def test_api_items_with_days(self, api_request):
         """アイテム一覧 API（期間指定）のテスト"""
-        response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items?days=30")
+        response = api_request.get(f"{URL_PREFIX}/api/items?days=30")
 
         # エラー時はレスポンスボディを表示（デバッグ用）
         assert response.ok, f"API error: {response.status} - {response.text()}"
         data = response.json()
         assert "items" in data
 
-    def test_api_item_history(self, page, host, port):
+    def test_api_item_history(self, api_request, items_api_response):
         """アイテム別価格履歴 API のテスト"""
-        # まずアイテム一覧を取得
-        items_response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items")
-        items_data = items_response.json()
+        items_data = items_api_response.json()
 
         if len(items_data.get("items", [])) == 0:
             pytest.skip("No items available for history test")
@@ -120,15 +133,15 @@ class TestWebuiE2E:
             pytest.skip("No stores available for history test")
 
         item_key = first_item["stores"][0]["item_key"]
-        response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items/{item_key}/history")
+        response = api_request.get(f"{URL_PREFIX}/api/items/{item_key}/history")
 
         assert response.ok
         data = response.json()
         assert "history" in data
 
-    def test_api_response_structure(self, page, host, port):
+    def test_api_response_structure(self, items_api_response):
         """API レスポンス構造のテスト（複数ストア対応）"""
-        response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items")
+        response = items_api_response
 
         # エラー時はレスポンスボディを表示（デバッグ用）
         assert response.ok, f"API error: {response.status} - {response.text()}"
@@ -153,7 +166,7 @@ class TestWebuiE2E:
                 assert "effective_price" in store
                 assert "point_rate" in store
 
-    def test_price_page_no_js_errors(self, page, host, port):
+    def test_price_page_no_js_errors(self, page, price_page_url):
         """JavaScript エラーがないことを確認
 
         1. 価格履歴ページにアクセス
@@ -164,7 +177,7 @@ class TestWebuiE2E:
         js_errors = []
         page.on("pageerror", lambda error: js_errors.append(str(error)))
 
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # ページのロード完了を待機
         page.wait_for_load_state("load")
@@ -172,7 +185,7 @@ class TestWebuiE2E:
         # JavaScript エラーがないこと
         assert len(js_errors) == 0, f"JavaScript エラーが発生しました: {js_errors}"
 
-    def test_item_cards_displayed(self, page, host, port):
+    def test_item_cards_displayed(self, page, price_page_url):
         """アイテムカードが表示されることを確認
 
         1. 価格履歴ページにアクセス
@@ -180,14 +193,13 @@ class TestWebuiE2E:
         """
         page.set_viewport_size({"width": 1920, "height": 1080})
 
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # アイテムカードが存在することを確認（ローディング完了まで待機）
-        # ItemCard.tsx のクラス: bg-white rounded-lg shadow-md
-        item_cards = page.locator("div.bg-white.rounded-lg.shadow-md")
+        item_cards = page.locator(SEL_ITEM_CARD)
         expect(item_cards.first).to_be_visible(timeout=30000)
 
-    def test_item_detail_page(self, page, host, port):
+    def test_item_detail_page(self, page, price_page_url):
         """アイテム詳細ページのテスト
 
         1. 価格履歴ページにアクセス
@@ -197,10 +209,10 @@ class TestWebuiE2E:
         """
         page.set_viewport_size({"width": 1920, "height": 1080})
 
-        page.goto(price_url(host, port), wait_until="domcontentloaded")
+        page.goto(price_page_url, wait_until="domcontentloaded")
 
         # アイテムカードが表示されるまで待機
-        item_cards = page.locator("div.bg-white.rounded-lg.shadow-md.cursor-pointer")
+        item_cards = page.locator(f"{SEL_ITEM_CARD}.cursor-pointer")
         expect(item_cards.first).to_be_visible(timeout=30000)
 
         # 最初のアイテムカードをクリック
@@ -222,21 +234,18 @@ class TestWebuiE2E:
 
         # スクリーンショットを保存
         screenshot_path = EVIDENCE_DIR / "e2e_item_detail_page.png"
-        screenshot_path.parent.mkdir(parents=True, exist_ok=True)
-        page.screenshot(path=str(screenshot_path), full_page=True)
+        page.screenshot(path=str(screenshot_path), full_page=EVIDENCE_FULL_PAGE)
 
         # 戻るボタンをクリック
         back_button.click()
 
         # 一覧ページに戻ることを確認（期間セレクタの存在で判断）
-        period_button = page.locator("button:has-text('30日')")
+        period_button = page.locator(SEL_PERIOD_30D)
         expect(period_button).to_be_visible(timeout=10000)
 
-    def test_api_item_events(self, page, host, port):
+    def test_api_item_events(self, api_request, items_api_response):
         """アイテム別イベント API のテスト"""
-        # まずアイテム一覧を取得
-        items_response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items")
-        items_data = items_response.json()
+        items_data = items_api_response.json()
 
         if len(items_data.get("items", [])) == 0:
             pytest.skip("No items available for events test")
@@ -247,7 +256,7 @@ class TestWebuiE2E:
             pytest.skip("No stores available for events test")
 
         item_key = first_item["stores"][0]["item_key"]
-        response = page.request.get(f"http://{host}:{port}{URL_PREFIX}/api/items/{item_key}/events")
+        response = api_request.get(f"{URL_PREFIX}/api/items/{item_key}/events")
 
         assert response.ok
         data = response.json()
@@ -6,17 +6,16 @@ HistoryManager integration テスト
 SQLite データベース操作の統合テストを行います。
 """
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
-import my_lib.time
 import time_machine
 
 if TYPE_CHECKING:
     from price_watch.managers.history import HistoryManager
 
 # 時間単位で異なる時刻を生成するためのベース時刻
-_BASE_TIME = my_lib.time.now().replace(hour=10, minute=0, second=0, microsecond=0)
+_BASE_TIME = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone(timedelta(hours=9)))
 
 
 class TestHistoryInit:
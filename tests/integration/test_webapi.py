@@ -9,22 +9,23 @@ Pydantic スキーマに準拠していることを検証します。
 
 import unittest.mock
 from collections.abc import Iterator
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import flask.testing
-import my_lib.time
 import pydantic
 import pytest
 import time_machine
 
+import price_watch.webapi.cache
+import price_watch.webapi.page
 import price_watch.webapi.schemas as schemas
 
 if TYPE_CHECKING:
     from price_watch.managers.history import HistoryManager
 
 # 時間単位で異なる時刻を生成するためのベース時刻
-_BASE_TIME = my_lib.time.now().replace(hour=10, minute=0, second=0, microsecond=0)
+_BASE_TIME = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone(timedelta(hours=9)))
 
 
 @pytest.fixture(autouse=True)
@@ -42,20 +43,20 @@ def mock_history_manager(
 class TestItemsEndpoint:
     """GET /price/api/items エンドポイントのテスト"""
 
+    @pytest.fixture(autouse=True)
+    def _without_target_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """target.yaml がない状態にする（全アイテム表示）"""
+        monkeypatch.setattr(price_watch.webapi.page, "_get_target_item_keys", lambda _target_config: set())
+        monkeypatch.setattr(price_watch.webapi.cache, "get_target_config", lambda: None)
+
     def test_get_items_empty(self, client: flask.testing.FlaskClient) -> None:
         """アイテムがない場合は空のリストを返す"""
-        with (
-            unittest.mock.patch("price_watch.webapi.page._get_target_item_keys", return_value=set()),
-            unittest.mock.patch("price_watch.webapi.cache.get_target_config", return_value=None),
-        ):
-            response = client.get("/price/api/items")
+        response = client.get("/price/api/items")
 
         assert response.status_code == 200
 
-        data = response.get_json()
-
         # Pydantic スキーマで検証
-        parsed = schemas.ItemsResponse.model_validate(data)
+        parsed = schemas.ItemsResponse.model_validate_json(response.data)
         assert parsed.items == []
         assert parsed.store_definitions == []
 
@@ -70,19 +71,12 @@ class TestItemsEndpoint:
         for item in sample_items:
             history_manager.insert(item)
 
-        # target.yaml がない状態でテスト（全アイテム表示）
-        with (
-            unittest.mock.patch("price_watch.webapi.page._get_target_item_keys", return_value=set()),
-            unittest.mock.patch("price_watch.webapi.cache.get_target_config", return_value=None),
-        ):
-            response = client.get("/price/api/items")
+        response = client.get("/price/api/items")
 
         assert response.status_code == 200
 
-        data = response.get_json()
-
         # Pydantic スキーマで検証
-        parsed = schemas.ItemsResponse.model_validate(data)
+        parsed = schemas.ItemsResponse.model_validate_json(response.data)
 
         # 商品Aと商品Bの2つの結果が返る
         assert len(parsed.items) == 2
@@ -103,16 +97,11 @@ class TestItemsEndpoint:
         """days パラメータが正しく処理される"""
         history_manager.insert(sample_item)
 
-        with (
-            unittest.mock.patch("price_watch.webapi.page._get_target_item_keys", return_value=set()),
-            unittest.mock.patch("price_watch.webapi.cache.get_target_config", return_value=None),
-        ):
-            response = client.get("/price/api/items?days=30")
+        response = client.get("/price/api/items?days=30")
 
         assert response.status_code == 200
 
-        data = response.get_json()
-        parsed = schemas.ItemsResponse.model_validate(data)
+        parsed = schemas.ItemsResponse.model_validate_json(response.data)
         assert isinstance(parsed.items, list)
 
     def test_get_items_with_all_days(
@@ -124,16 +113,11 @@ class TestItemsEndpoint:
         """days=all で全期間のデータを取得"""
         history_manager.insert(sample_item)
 
-        with (
-            unittest.mock.patch("price_watch.webapi.page._get_target_item_keys", return_value=set()),
-            unittest.mock.patch("price_watch.webapi.cache.get_target_config", return_value=None),
-        ):
-            response = client.get("/price/api/items?days=all")
+        response = client.get("/price/api/items?days=all")
 
         assert response.status_code == 200
 
-        data = response.get_json()
-        parsed = schemas.ItemsResponse.model_validate(data)
+        parsed = schemas.ItemsResponse.model_validate_json(response.data)
         assert isinstance(parsed.items, list)
 
     def test_get_items_response_structure(
@@ -146,11 +130,7 @@ class TestItemsEndpoint:
         for item in sample_items:
             history_manager.insert(item)
 
-        with (
-            unittest.mock.patch("price_watch.webapi.page._get_target_item_keys", return_value=set()),
-            unittest.mock.patch("price_watch.webapi.cache.get_target_config", return_value=None),
-        ):
-            response = client.get("/price/api/items")
+        response = client.get("/price/api/items")
 
         data = response.get_json()
 
@@ -190,10 +170,8 @@ class TestItemHistoryEndpoint:
 
         assert response.status_code == 404
 
-        data = response.get_json()
-
         # エラーレスポンスの検証
-        parsed = schemas.ErrorResponse.model_validate(data)
+        parsed = schemas.ErrorResponse.model_validate_json(response.data)
         assert parsed.error == "Item not found"
 
     def test_get_history_success(
@@ -214,10 +192,8 @@ class TestItemHistoryEndpoint:
 
         assert response.status_code == 200
 
-        data = response.get_json()
-
         # Pydantic スキーマで検証
-        parsed = schemas.HistoryResponse.model_validate(data)
+        parsed = schemas.HistoryResponse.model_validate_json(response.data)
         assert len(parsed.history) == 1
 
         # 履歴エントリの内容を検証
@@ -261,8 +237,7 @@ class TestItemHistoryEndpoint:
 
         assert response.status_code == 200
 
-        data = response.get_json()
-        parsed = schemas.HistoryResponse.model_validate(data)
+        parsed = schemas.HistoryResponse.model_validate_json(response.data)
 
         assert len(parsed.history) == 3
 
@@ -282,8 +257,7 @@ class TestItemHistoryEndpoint:
 
         assert response.status_code == 200
 
-        data = response.get_json()
-        parsed = schemas.HistoryResponse.model_validate(data)
+        parsed = schemas.HistoryResponse.model_validate_json(response.data)
         assert isinstance(parsed.history, list)
 
 
@@ -368,7 +342,6 @@ class TestErrorHandling:
 
         assert response.status_code == 500
 
-        data = response.get_json()
-        parsed = schemas.ErrorResponse.model_validate(data)
+        parsed = schemas.ErrorResponse.model_validate_json(response.data)
         # エラーメッセージにはデバッグ用の詳細情報が含まれる場合がある
         assert parsed.error.startswith("Internal server error")
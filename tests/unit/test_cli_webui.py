@@ -61,7 +61,7 @@ class TestWebUIRunnerStart:
         ):
             runner.start()
 
-        mock_start.assert_called_once_with(5000, static_dir_path=static_dir)
+        mock_start.assert_called_once_with(5000, static_dir_path=static_dir, debug_mode=False)
         assert runner.server_handle is mock_handle
         assert runner.config is mock_config
 
@@ -393,6 +393,15 @@ class TestEditConfig:
         result = EditConfig.parse(data)
         assert result.password_hash == "$argon2id$v=19$m=65536,t=3,p=4$test$hash"
         assert result.git is None
+        assert result.backup_count == 10
+
+    def test_parse_with_backup_count(self) -> None:
+        """バックアップ数の指定"""
+        from price_watch.config import EditConfig
+
+        data = {"password_hash": "$argon2id$v=19$m=65536,t=3,p=4$test$hash", "backup_count": 3}
+        result = EditConfig.parse(data)
+        assert result.backup_count == 3
 
     def test_parse_with_git(self) -> None:
         """Git 設定あり"""
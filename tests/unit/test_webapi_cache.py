@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/cache.py のユニットテスト
+
+価格履歴レスポンスのキャッシュを検証します。
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import pathlib
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import price_watch.webapi.cache
+
+
+class TestGetHistoryResponse:
+    """get_history_response 関数のテスト"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
+        db_path = tmp_path / "price.db"
+        db_path.write_bytes(b"v1")
+        manager = MagicMock()
+        manager.db.db_path = db_path
+        price_watch.webapi.cache.clear_history_response_cache()
+        with (
+            patch.object(price_watch.webapi.cache, "get_history_manager", return_value=manager),
+            patch.object(price_watch.webapi.cache, "get_target_config", return_value=None),
+        ):
+            yield db_path
+        price_watch.webapi.cache.clear_history_response_cache()
+
+    def _get(self, days: int | None, raw: bytes) -> bytes:
+        body = price_watch.webapi.cache.get_history_response("item", days, lambda: raw)
+        assert body is not None
+        return body.raw
+
+    def test_reuses_until_db_changes(self, db_path: pathlib.Path):
+        """DB が変わるまではキャッシュした内容を返す"""
+        assert self._get(None, b"first") == b"first"
+        assert self._get(None, b"second") == b"first"
+
+        db_path.write_bytes(b"v2 longer")
+
+        assert self._get(None, b"third") == b"third"
+
+    def test_detects_replaced_db_with_same_mtime(self, db_path: pathlib.Path):
+        """更新時刻が同じでも DB ファイルが置き換えられた場合は作り直す"""
+        mtime_ns = db_path.stat().st_mtime_ns
+        assert self._get(None, b"first") == b"first"
+
+        replacement = db_path.with_name("price.db.new")
+        replacement.write_bytes(b"v1")
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        replacement.replace(db_path)
+
+        assert self._get(None, b"second") == b"second"
+
+    def test_relative_window_expires_on_date_change(self, db_path: pathlib.Path):
+        """期間指定の履歴は日付が変わると作り直す"""
+        day1 = datetime.datetime(2024, 1, 15, 23, 59, tzinfo=datetime.UTC)
+        day2 = datetime.datetime(2024, 1, 16, 0, 1, tzinfo=datetime.UTC)
+
+        with patch("my_lib.time.now", return_value=day1):
+            assert self._get(30, b"first") == b"first"
+            assert self._get(30, b"second") == b"first"
+        with patch("my_lib.time.now", return_value=day2):
+            assert self._get(30, b"third") == b"third"
+
+    def test_clear(self, db_path: pathlib.Path):
+        """キャッシュのクリア"""
+        assert self._get(None, b"first") == b"first"
+
+        price_watch.webapi.cache.clear_history_response_cache()
+
+        assert self._get(None, b"second") == b"second"
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/compression.py のユニットテスト
+
+API レスポンスの圧縮を検証します。
+"""
+
+from __future__ import annotations
+
+import gzip
+
+import brotli
+import pytest
+
+import price_watch.webapi.compression
+
+_DECOMPRESS = {"br": brotli.decompress, "gzip": gzip.decompress}
+
+
+@pytest.mark.parametrize("encoding", ["br", "gzip"])
+class TestCompress:
+    """compress / compress_stream のテスト"""
+
+    def test_compress_roundtrip(self, encoding: str) -> None:
+        """圧縮したバイト列を元に戻せる"""
+        data = b'{"history":[' + b'{"price":1000},' * 100 + b"]}"
+
+        result = price_watch.webapi.compression.compress(data, encoding)
+
+        assert len(result) < len(data)
+        assert _DECOMPRESS[encoding](result) == data
+
+    def test_compress_stream_roundtrip(self, encoding: str) -> None:
+        """チャンクごとに圧縮した結果を連結すると元に戻せる"""
+        chunks = [b'{"items":[', b'{"name":"a"},' * 50, b'{"name":"b"}', b"]}"]
+
+        result = b"".join(price_watch.webapi.compression.compress_stream(iter(chunks), encoding))
+
+        assert _DECOMPRESS[encoding](result) == b"".join(chunks)
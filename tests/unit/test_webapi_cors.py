@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/cors.py のユニットテスト
+
+API エンドポイント向けの CORS ミドルウェアを検証します。
+"""
+
+from __future__ import annotations
+
+import werkzeug.test
+import werkzeug.wrappers
+
+import price_watch.webapi.cors
+
+
+@werkzeug.wrappers.Request.application
+def _app(_request: werkzeug.wrappers.Request) -> werkzeug.wrappers.Response:
+    return werkzeug.wrappers.Response("ok", headers={"Vary": "Accept-Encoding"})
+
+
+def _client(origins: list[str] | str) -> werkzeug.test.Client:
+    return werkzeug.test.Client(price_watch.webapi.cors.CorsMiddleware(_app, "/price/api/", origins))
+
+
+class TestCorsMiddleware:
+    """CorsMiddleware のテスト"""
+
+    def test_allows_matching_origin(self) -> None:
+        """許可オリジンからのリクエストにはオリジンを返す"""
+        client = _client(["https://example.com"])
+
+        response = client.get("/price/api/items", headers={"Origin": "https://Example.com"})
+
+        assert response.headers["Access-Control-Allow-Origin"] == "https://Example.com"
+        assert response.headers.getlist("Vary") == ["Accept-Encoding", "Origin"]
+        assert response.get_data() == b"ok"
+
+    def test_ignores_other_origin(self) -> None:
+        """許可されていないオリジンには CORS ヘッダーを付与しない"""
+        client = _client(["https://example.com"])
+
+        response = client.get("/price/api/items", headers={"Origin": "https://evil.example"})
+
+        assert "Access-Control-Allow-Origin" not in response.headers
+        assert response.headers.getlist("Vary") == ["Accept-Encoding", "Origin"]
+
+    def test_vary_without_origin(self) -> None:
+        """Origin なしのリクエストにも Vary: Origin を付与する"""
+        client = _client(["https://example.com"])
+
+        response = client.get("/price/api/items")
+
+        assert "Access-Control-Allow-Origin" not in response.headers
+        assert response.headers.getlist("Vary") == ["Accept-Encoding", "Origin"]
+
+    def test_allow_all(self) -> None:
+        """全許可の場合はワイルドカードを返す"""
+        client = _client("*")
+
+        response = client.get("/price/api/items", headers={"Origin": "https://any.example"})
+
+        assert response.headers["Access-Control-Allow-Origin"] == "*"
+
+    def test_only_under_path_prefix(self) -> None:
+        """API 以外のパスには CORS ヘッダーを付与しない"""
+        client = _client("*")
+
+        response = client.get("/price/thumb/a.png", headers={"Origin": "https://any.example"})
+
+        assert "Access-Control-Allow-Origin" not in response.headers
+
+    def test_preflight(self) -> None:
+        """プリフライトにはアプリを経由せず 204 で応答する"""
+        client = _client(["https://example.com"])
+
+        response = client.options(
+            "/price/api/target",
+            headers={
+                "Origin": "https://example.com",
+                "Access-Control-Request-Method": "PUT",
+                "Access-Control-Request-Headers": "Content-Type",
+            },
+        )
+
+        assert response.status_code == 204
+        assert response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+        assert "PUT" in response.headers["Access-Control-Allow-Methods"]
+        assert response.headers["Access-Control-Allow-Headers"] == "Content-Type"
+        assert response.get_data() == b""
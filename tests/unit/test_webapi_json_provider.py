@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/json_provider.py のユニットテスト
+
+orjson ベースの JSON プロバイダーを検証します。
+"""
+
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import pathlib
+
+import flask
+import pydantic
+import pytest
+
+import price_watch.webapi.json_provider
+
+
+@pytest.fixture
+def app() -> flask.Flask:
+    """orjson プロバイダーを設定した Flask アプリケーション."""
+    app = flask.Flask(__name__)
+    app.json = price_watch.webapi.json_provider.ORJSONProvider(app)
+    return app
+
+
+class TestORJSONProvider:
+    """ORJSONProvider クラスのテスト"""
+
+    def test_jsonify_returns_json_response(self, app: flask.Flask):
+        """jsonify で JSON レスポンスを生成"""
+        with app.app_context():
+            response = flask.jsonify({"name": "商品", "price": 1000, "history": [1, 2]})
+
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data) == {"name": "商品", "price": 1000, "history": [1, 2]}
+
+    def test_non_ascii_is_not_escaped(self, app: flask.Flask):
+        """日本語はエスケープせずに出力"""
+        assert app.json.dumps({"name": "商品"}) == '{"name":"商品"}'
+
+    def test_non_str_keys(self, app: flask.Flask):
+        """int キーを文字列として出力"""
+        assert json.loads(app.json.dumps({1: "a"})) == {"1": "a"}
+
+    def test_datetime_is_http_date(self, app: flask.Flask):
+        """datetime は Flask 標準と同じ HTTP 日付形式"""
+        value = datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.UTC)
+
+        result = json.loads(app.json.dumps({"time": value}))
+
+        assert result["time"] == "Mon, 15 Jan 2024 10:30:00 GMT"
+
+    def test_decimal_and_path(self, app: flask.Flask):
+        """Decimal と Path は文字列化"""
+        result = json.loads(app.json.dumps({"d": decimal.Decimal("1.5"), "p": pathlib.Path("/tmp/a")}))  # noqa: S108
+
+        assert result == {"d": "1.5", "p": "/tmp/a"}  # noqa: S108
+
+    def test_unsupported_type_raises(self, app: flask.Flask):
+        """未対応の型は TypeError"""
+        with pytest.raises(TypeError):
+            app.json.dumps({"obj": object()})
+
+    def test_sort_keys(self, app: flask.Flask):
+        """sort_keys 指定でキーをソート"""
+        assert app.json.dumps({"b": 1, "a": 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+    def test_loads(self, app: flask.Flask):
+        """文字列・バイト列をデシリアライズ"""
+        assert app.json.loads('{"a": 1}') == {"a": 1}
+        assert app.json.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_request_get_json(self, app: flask.Flask):
+        """リクエストボディのパースにも使用される"""
+
+        @app.route("/echo", methods=["POST"])
+        def echo() -> flask.Response:
+            return flask.jsonify(flask.request.get_json())
+
+        response = app.test_client().post("/echo", json={"price": 100})
+
+        assert response.get_json() == {"price": 100}
+
+
+class TestSchemaResponse:
+    """schema_response 関数のテスト"""
+
+    def test_serializes_schema_directly(self, app: flask.Flask):
+        """pydantic モデルを JSON レスポンスに変換"""
+
+        class _Item(pydantic.BaseModel):
+            name: str
+            price: int | None
+
+        with app.app_context():
+            response = price_watch.webapi.json_provider.schema_response(_Item(name="商品", price=None))
+
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data) == {"name": "商品", "price": None}
@@ -8,10 +8,15 @@ Web API エンドポイントを検証します。
 
 from __future__ import annotations
 
+import gzip
+import json
+import os
 import pathlib
 from unittest.mock import MagicMock, patch
 
+import brotli
 import flask
+import msgspec
 import pytest
 
 import price_watch.managers.history
@@ -20,6 +25,7 @@ import price_watch.target
 import price_watch.webapi.cache
 import price_watch.webapi.metrics
 import price_watch.webapi.page
+import price_watch.webapi.string_pool
 
 
 @pytest.fixture
@@ -444,6 +450,42 @@ class TestGetItems:
 
         assert response.status_code == 200
 
+    def test_returns_packed_items_when_requested(self, client: flask.testing.FlaskClient) -> None:
+        """文字列プール形式が要求された場合はパックして返す"""
+        mock_items = [
+            price_watch.models.ItemRecord(
+                id=1,
+                name="Item1",
+                store="Store1",
+                item_key="key1",
+                url="http://example.com",
+                thumb_url="http://example.com/thumb.png",
+                search_keyword=None,
+            )
+        ]
+
+        mock_history_manager = MagicMock()
+        mock_history_manager.get_all_items.return_value = mock_items
+        mock_history_manager.get_latest.return_value = None
+        mock_history_manager.get_all_latest.return_value = {}
+        mock_history_manager.get_all_stats.return_value = {}
+
+        with (
+            patch.object(price_watch.webapi.cache._target_config_cache, "get", return_value=None),
+            patch.object(price_watch.webapi.cache, "get_history_manager", return_value=mock_history_manager),
+        ):
+            plain = client.get("/price/api/items")
+            packed = client.get(
+                "/price/api/items", headers={"Accept": price_watch.webapi.string_pool.PACKED_MIMETYPE}
+            )
+
+        assert packed.status_code == 200
+        assert packed.mimetype == price_watch.webapi.string_pool.PACKED_MIMETYPE
+        assert "Accept" in packed.headers["Vary"]
+        data = json.loads(packed.data)
+        assert "strings" in data
+        assert price_watch.webapi.string_pool.unpack(data) == plain.get_json()
+
     def test_handles_exception(self, client: flask.testing.FlaskClient) -> None:
         """例外時は 500 を返す"""
         mock_history_manager = MagicMock()
@@ -457,6 +499,13 @@ class TestGetItems:
 
         assert response.status_code == 500
 
+    def test_rejects_invalid_days(self, client: flask.testing.FlaskClient) -> None:
+        """不正な days は 400 を返す"""
+        response = client.get("/price/api/items?days=7")
+
+        assert response.status_code == 400
+        assert "query_params" in response.get_json()["validation_error"]
+
 
 class TestGetItemHistory:
     """get_item_history エンドポイントのテスト"""
@@ -487,6 +536,114 @@ class TestGetItemHistory:
         data = response.get_json()
         assert "history" in data
 
+    def test_returns_msgpack_when_requested(self, client: flask.testing.FlaskClient) -> None:
+        """Accept: application/msgpack の場合は msgpack で返す"""
+        mock_item = price_watch.models.ItemRecord(
+            id=1,
+            item_key="key1",
+            name="Item1",
+            store="Store1",
+            url="http://example.com",
+            thumb_url=None,
+            search_keyword=None,
+        )
+        mock_history = [price_watch.models.PriceRecord(time="2024-01-15 10:00:00", price=1000, stock=1)]
+
+        mock_history_manager = MagicMock()
+        mock_history_manager.get_history.return_value = (mock_item, mock_history)
+
+        with (
+            patch.object(price_watch.webapi.cache._target_config_cache, "get", return_value=None),
+            patch.object(price_watch.webapi.cache, "get_history_manager", return_value=mock_history_manager),
+        ):
+            response = client.get("/price/api/items/key1/history", headers={"Accept": "application/msgpack"})
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/msgpack"
+        assert "Accept" in response.headers["Vary"]
+        data = msgspec.msgpack.decode(response.data)
+        assert data == {
+            "history": [{"time": "2024-01-15 10:00:00", "price": 1000, "effective_price": 1000, "stock": 1}]
+        }
+
+    def test_caches_encoded_history_until_db_changes(
+        self, client: flask.testing.FlaskClient, tmp_path: pathlib.Path
+    ) -> None:
+        """DB が更新されるまでエンコード済みの履歴を再利用する"""
+        db_path = tmp_path / "price.db"
+        db_path.write_bytes(b"")
+        mock_item = price_watch.models.ItemRecord(
+            id=1,
+            item_key="key1",
+            name="Item1",
+            store="Store1",
+            url="http://example.com",
+            thumb_url=None,
+            search_keyword=None,
+        )
+        mock_history = [price_watch.models.PriceRecord(time="2024-01-15 10:00:00", price=1000, stock=1)]
+
+        mock_history_manager = MagicMock()
+        mock_history_manager.db.db_path = db_path
+        mock_history_manager.get_history.return_value = (mock_item, mock_history)
+
+        with (
+            patch.object(price_watch.webapi.cache._target_config_cache, "get", return_value=None),
+            patch.object(price_watch.webapi.cache, "get_history_manager", return_value=mock_history_manager),
+        ):
+            first = client.get("/price/api/items/key1/history")
+            second = client.get("/price/api/items/key1/history")
+            assert mock_history_manager.get_history.call_count == 1
+
+            stat = db_path.stat()
+            os.utime(db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            client.get("/price/api/items/key1/history")
+            assert mock_history_manager.get_history.call_count == 2
+
+        assert first.data == second.data
+        assert second.get_json()["history"][0]["effective_price"] == 1000
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected_encoding"),
+        [("gzip, deflate, br", "br"), ("gzip", "gzip"), ("identity", None)],
+    )
+    def test_returns_precompressed_history(
+        self,
+        client: flask.testing.FlaskClient,
+        accept_encoding: str,
+        expected_encoding: str | None,
+    ) -> None:
+        """Accept-Encoding に応じて事前圧縮済みの履歴を返す"""
+        mock_item = price_watch.models.ItemRecord(
+            id=1,
+            item_key="key1",
+            name="Item1",
+            store="Store1",
+            url="http://example.com",
+            thumb_url=None,
+            search_keyword=None,
+        )
+        mock_history = [price_watch.models.PriceRecord(time="2024-01-15 10:00:00", price=1000, stock=1)]
+
+        mock_history_manager = MagicMock()
+        mock_history_manager.get_history.return_value = (mock_item, mock_history)
+
+        with (
+            patch.object(price_watch.webapi.cache._target_config_cache, "get", return_value=None),
+            patch.object(price_watch.webapi.cache, "get_history_manager", return_value=mock_history_manager),
+        ):
+            response = client.get(
+                "/price/api/items/key1/history", headers={"Accept-Encoding": accept_encoding}
+            )
+
+        assert response.status_code == 200
+        assert response.content_encoding == expected_encoding
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+        decompress = {"br": brotli.decompress, "gzip": gzip.decompress, None: bytes}[expected_encoding]
+        data = json.loads(decompress(response.data))
+        assert data["history"][0]["price"] == 1000
+
     def test_returns_404_for_missing_item(self, client: flask.testing.FlaskClient) -> None:
         """アイテムがない場合は 404"""
         mock_history_manager = MagicMock()
@@ -8,6 +8,8 @@ Argon2id パスワードハッシュの生成と検証を検証します。
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import price_watch.webapi.password
 
 
@@ -111,3 +113,41 @@ class TestVerifyPassword:
         result = price_watch.webapi.password.verify_password(password, password_hash)
 
         assert result is True
+
+
+class TestVerifyConcurrency:
+    """verify_password の同時実行制限のテスト"""
+
+    def test_limits_concurrent_verification(self, monkeypatch):
+        """同時に実行される検証数が上限を超えない"""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+
+        def slow_verify(password_hash, password):
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return True
+
+        hasher = MagicMock()
+        hasher.verify.side_effect = slow_verify
+        monkeypatch.setattr(price_watch.webapi.password, "_hasher", hasher)
+
+        threads = [
+            threading.Thread(target=price_watch.webapi.password.verify_password, args=("p", "h"))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max_active <= price_watch.webapi.password._VERIFY_CONCURRENCY
@@ -8,10 +8,16 @@ Web API サーバーの作成・起動・停止を検証します。
 
 from __future__ import annotations
 
+import contextlib
+import datetime
+import gzip
 import pathlib
+import sqlite3
 import threading
+import urllib.request
 from unittest.mock import MagicMock, patch
 
+import brotli
 import flask
 
 import price_watch.webapi.server
@@ -69,6 +75,131 @@ class TestGetCorsOrigins:
         assert result == "*"
 
 
+class TestDbWatcher:
+    """メトリクス DB 監視のテスト"""
+
+    def _state(self, total_items: int) -> price_watch.webapi.server._MetricsDataState:
+        return price_watch.webapi.server._MetricsDataState(
+            has_active_session=True,
+            is_crawling=True,
+            last_heartbeat_at="2024-01-15 10:00:00",
+            total_items=total_items,
+        )
+
+    def test_notifies_only_on_state_change(self, tmp_path: pathlib.Path):
+        """状態が変化した場合のみ通知"""
+        db_path = tmp_path / "metrics.db"
+        states = [self._state(1), self._state(1), self._state(2)]
+
+        with (
+            patch.object(price_watch.webapi.server, "_get_metrics_data_state", side_effect=states),
+            patch("watchfiles.watch", return_value=iter([set(), set()])),
+            patch("my_lib.webapp.event.notify_event") as mock_notify,
+        ):
+            price_watch.webapi.server._watch_db_state(db_path, threading.Event())
+
+        mock_notify.assert_called_once()
+
+    def test_watch_filter_matches_db_and_wal(self, tmp_path: pathlib.Path):
+        """DB 本体と WAL ファイルのみを監視対象にする"""
+        db_path = tmp_path / "metrics.db"
+
+        with (
+            patch.object(price_watch.webapi.server, "_get_metrics_data_state", return_value=None),
+            patch("watchfiles.watch", return_value=iter([])) as mock_watch,
+        ):
+            price_watch.webapi.server._watch_db_state(db_path, threading.Event())
+
+        watch_filter = mock_watch.call_args.kwargs["watch_filter"]
+        assert watch_filter(None, str(db_path))
+        assert watch_filter(None, str(tmp_path / "metrics.db-wal"))
+        assert not watch_filter(None, str(tmp_path / "other.db"))
+        # 通知がなくても定期的に状態を再確認する
+        assert mock_watch.call_args.kwargs["yield_on_timeout"] is True
+        # 連続した通知はまとめて 1 回だけ再確認する
+        assert mock_watch.call_args.kwargs["step"] == price_watch.webapi.server._WATCH_STEP_MS
+
+    def test_waits_for_missing_directory(self, tmp_path: pathlib.Path):
+        """監視対象のディレクトリが作成されるまで待ってから監視を開始"""
+        db_path = tmp_path / "data" / "metrics.db"
+        timer = threading.Timer(0.05, db_path.parent.mkdir)
+
+        with (
+            patch.object(price_watch.webapi.server, "_WATCH_HOUSEKEEPING_MS", 10),
+            patch.object(price_watch.webapi.server, "_get_metrics_data_state", return_value=None),
+            patch("watchfiles.watch", return_value=iter([])) as mock_watch,
+        ):
+            timer.start()
+            price_watch.webapi.server._watch_db_state(db_path, threading.Event())
+            timer.join()
+
+        mock_watch.assert_called_once()
+
+    def test_stops_while_waiting_for_directory(self, tmp_path: pathlib.Path):
+        """ディレクトリ待機中に停止要求があれば監視せずに終了"""
+        stop_event = threading.Event()
+        stop_event.set()
+
+        with (
+            patch.object(price_watch.webapi.server, "_get_metrics_data_state", return_value=None),
+            patch("watchfiles.watch") as mock_watch,
+        ):
+            price_watch.webapi.server._watch_db_state(tmp_path / "data" / "metrics.db", stop_event)
+
+        mock_watch.assert_not_called()
+
+    def test_missing_db_has_no_state(self, tmp_path: pathlib.Path):
+        """DB ファイルがない場合はトレースバックを出さずに状態なしとする"""
+        with patch("logging.exception") as mock_exception:
+            state = price_watch.webapi.server._get_metrics_data_state(tmp_path / "metrics.db")
+
+        assert state is None
+        mock_exception.assert_not_called()
+
+    def _create_db(self, db_path: pathlib.Path, total_items: int | None) -> None:
+        with contextlib.closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE crawl_sessions (started_at TEXT, ended_at TEXT, "
+                "last_heartbeat_at TEXT, work_ended_at TEXT, total_items INTEGER)"
+            )
+            if total_items is not None:
+                conn.execute(
+                    "INSERT INTO crawl_sessions VALUES ('2024-01-15 10:00:00', NULL, NULL, NULL, ?)",
+                    (total_items,),
+                )
+
+    def test_reopens_when_db_is_recreated(self, tmp_path: pathlib.Path):
+        """DB ファイルが削除・再作成された場合は接続を開き直す"""
+        db_path = tmp_path / "metrics.db"
+        self._create_db(db_path, None)
+        try:
+            state = price_watch.webapi.server._get_metrics_data_state(db_path)
+            assert state is not None
+            assert not state.has_active_session
+
+            db_path.unlink()
+            self._create_db(db_path, 5)
+
+            state = price_watch.webapi.server._get_metrics_data_state(db_path)
+            assert state is not None
+            assert state.has_active_session
+            assert state.total_items == 5
+        finally:
+            price_watch.webapi.server._close_state_conn()
+
+    def test_start_and_stop(self, tmp_path: pathlib.Path):
+        """監視スレッドの開始と停止"""
+        with (
+            patch.object(price_watch.webapi.server, "_get_metrics_data_state", return_value=None),
+            patch("watchfiles.watch", return_value=iter([])),
+        ):
+            price_watch.webapi.server.start_db_watcher(tmp_path / "metrics.db")
+            price_watch.webapi.server.stop_db_watcher()
+
+        assert price_watch.webapi.server._watch_thread is None
+        assert price_watch.webapi.server._watch_stop_event is None
+
+
 class TestCreateApp:
     """create_app 関数のテスト"""
 
@@ -87,6 +218,21 @@ class TestCreateApp:
         assert isinstance(app, flask.Flask)
         assert app.name == "price_watch_webui"
 
+    def test_show_handler_list_only_in_debug_mode(self, tmp_path: pathlib.Path):
+        """ルーティング一覧はデバッグモードのときのみ出力する"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = None
+
+        with (
+            patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
+            patch("my_lib.webapp.config.show_handler_list") as mock_show,
+        ):
+            price_watch.webapi.server.create_app(static_dir_path=tmp_path)
+            mock_show.assert_not_called()
+
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path, debug_mode=True)
+            mock_show.assert_called_once_with(app)
+
     def test_create_app_without_static_dir(self, tmp_path: pathlib.Path):
         """静的ディレクトリが存在しない場合"""
         static_dir = tmp_path / "nonexistent"
@@ -116,6 +262,215 @@ class TestCreateApp:
         # 静的ファイルのブループリントが登録されていることを確認
         assert "webapp-base" in [bp.name for bp in app.iter_blueprints()]
 
+    def test_cors_only_on_api(self, tmp_path: pathlib.Path):
+        """CORS ヘッダーは API エンドポイントにのみ付与"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = "https://example.com/price/"
+
+        with patch("price_watch.webapi.cache.get_app_config", return_value=mock_config):
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path / "nonexistent")
+
+        client = app.test_client()
+        headers = {"Origin": "https://example.com"}
+        api_response = client.get("/price/api/sysinfo", headers=headers)
+        thumb_response = client.get("/price/thumb/missing.png", headers=headers)
+
+        assert api_response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+        assert "Access-Control-Allow-Origin" not in thumb_response.headers
+
+    def test_cache_control_per_route(self, tmp_path: pathlib.Path):
+        """参照系 API はキャッシュ可、編集系 API はキャッシュ不可"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = None
+
+        with patch("price_watch.webapi.cache.get_app_config", return_value=mock_config):
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path / "nonexistent")
+
+        client = app.test_client()
+        sysinfo_response = client.get("/price/api/sysinfo")
+        validate_response = client.post("/price/api/target/validate", data=b"{}")
+
+        assert sysinfo_response.headers["Cache-Control"] == price_watch.webapi.server._API_CACHE_CONTROL
+        assert "stale-while-revalidate" in sysinfo_response.headers["Cache-Control"]
+        assert validate_response.headers["Cache-Control"] == "no-store"
+
+    def test_returns_304_when_etag_matches(self, tmp_path: pathlib.Path):
+        """ETag が一致する条件付きリクエストには 304 を返す"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = None
+
+        with patch("price_watch.webapi.cache.get_app_config", return_value=mock_config):
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path / "nonexistent")
+
+        client = app.test_client()
+        now = datetime.datetime(2024, 1, 15, 10, 0, 0)
+        with patch("my_lib.time.now", return_value=now), patch("os.getloadavg", return_value=(0.0, 0.0, 0.0)):
+            first = client.get("/price/api/sysinfo")
+            second = client.get("/price/api/sysinfo", headers={"If-None-Match": first.headers["ETag"]})
+            third = client.get("/price/api/sysinfo", headers={"If-None-Match": '"other"'})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b""
+        assert third.status_code == 200
+
+    def test_items_json_supports_etag(self, tmp_path: pathlib.Path):
+        """JSON 形式のアイテム一覧も ETag が一致すれば 304 を返す"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = None
+        mock_config.check.interval_sec = 1800
+        mock_history_manager = MagicMock()
+        mock_history_manager.get_all_items.return_value = []
+        mock_history_manager.get_all_latest.return_value = {}
+        mock_history_manager.get_all_stats.return_value = {}
+
+        with patch("price_watch.webapi.cache.get_app_config", return_value=mock_config):
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path / "nonexistent")
+
+        client = app.test_client()
+        with (
+            patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
+            patch("price_watch.webapi.cache.get_target_config", return_value=None),
+            patch("price_watch.webapi.cache.get_history_manager", return_value=mock_history_manager),
+        ):
+            first = client.get("/price/api/items")
+            second = client.get("/price/api/items", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert first.is_json
+        assert second.status_code == 304
+
+    def test_unhandled_exception_returns_json_500(self, tmp_path: pathlib.Path):
+        """未処理例外は JSON の 500 レスポンスになる"""
+        mock_config = MagicMock()
+        mock_config.webapp.external_url = None
+
+        with patch("price_watch.webapi.cache.get_app_config", return_value=mock_config):
+            app = price_watch.webapi.server.create_app(static_dir_path=tmp_path / "nonexistent")
+
+        with patch("os.getloadavg", side_effect=RuntimeError("boom")):
+            response = app.test_client().get("/price/api/sysinfo")
+
+        assert response.status_code == 500
+        assert response.get_json() == {"error": "Internal Server Error"}
+        assert response.headers["Cache-Control"] == "no-store"
+
+
+class TestCompressResponse:
+    """_compress_response 関数のテスト"""
+
+    def _compress(self, response: flask.Response, accept_encoding: str = "gzip, br") -> flask.Response:
+        app = flask.Flask(__name__)
+        with app.test_request_context(headers={"Accept-Encoding": accept_encoding}):
+            price_watch.webapi.server._compress_response(response)
+        return response
+
+    def test_compresses_large_body(self):
+        """一定サイズ以上の本文を圧縮"""
+        body = b'{"price":1000},' * 200
+        response = self._compress(flask.Response(body, mimetype="application/json"))
+
+        assert response.content_encoding == "br"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert brotli.decompress(response.get_data()) == body
+
+    def test_skips_small_body(self):
+        """小さい本文は圧縮しない"""
+        response = self._compress(flask.Response(b"{}", mimetype="application/json"))
+
+        assert response.content_encoding is None
+        assert response.get_data() == b"{}"
+
+    def test_skips_without_accept_encoding(self):
+        """Accept-Encoding が圧縮に対応していなければ圧縮しない"""
+        body = b'{"price":1000},' * 200
+        response = self._compress(flask.Response(body, mimetype="application/json"), "identity")
+
+        assert response.content_encoding is None
+
+    def test_skips_event_stream(self):
+        """SSE は圧縮しない"""
+        response = self._compress(flask.Response(iter([b"data: 1\n\n"]), mimetype="text/event-stream"))
+
+        assert response.content_encoding is None
+
+    def test_compresses_streamed_body(self):
+        """ストリーミングレスポンスはチャンクごとに圧縮"""
+        chunks = [b'{"items":[', b'{"name":"a"},' * 100, b"{}]}"]
+        response = self._compress(flask.Response(iter(chunks), mimetype="application/json"), "gzip")
+
+        assert response.content_encoding == "gzip"
+        assert gzip.decompress(b"".join(response.response)) == b"".join(chunks)
+
+
+class TestErrorLogSampler:
+    """_ErrorLogSampler のテスト"""
+
+    def test_limits_burst_and_refills(self):
+        """連続 burst 件を超えると抑制し、時間経過で抑制件数とともに再開"""
+        with patch("time.monotonic", return_value=100.0):
+            sampler = price_watch.webapi.server._ErrorLogSampler(rate=1.0, burst=2.0)
+            results = [sampler.acquire() for _ in range(4)]
+
+        assert results == [0, 0, None, None]
+
+        with patch("time.monotonic", return_value=101.0):
+            assert sampler.acquire() == 2
+            assert sampler.acquire() is None
+
+    def test_logs_traceback_only_when_sampled(self):
+        """抑制中はトレースバックなしのエラーログのみ出力"""
+        sampler = price_watch.webapi.server._ErrorLogSampler(rate=0.0, burst=1.0)
+        error = ValueError("boom")
+
+        with (
+            patch.object(price_watch.webapi.server, "_error_log_sampler", sampler),
+            patch("logging.exception") as mock_exception,
+            patch("logging.error") as mock_error,
+        ):
+            price_watch.webapi.server._log_unhandled_exception("Unhandled exception", error)
+            price_watch.webapi.server._log_unhandled_exception("Unhandled exception", error)
+
+        mock_exception.assert_called_once()
+        mock_error.assert_called_once()
+
+
+class TestWebUIServer:
+    """_WebUIServer クラスのテスト"""
+
+    def test_serves_requests_while_stream_is_open(self):
+        """開いたままのストリーミング接続があっても他のリクエストを処理する"""
+        release = threading.Event()
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            if environ["PATH_INFO"] == "/stream":
+                release.wait(timeout=10)
+            return [b"ok"]
+
+        server = price_watch.webapi.server._WebUIServer("127.0.0.1", 0, app)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        port = server.server_port
+
+        def _open_stream():
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/stream", timeout=10) as res:
+                res.read()
+
+        stream = threading.Thread(target=_open_stream, daemon=True)
+        try:
+            stream.start()
+            for _ in range(3):
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as res:
+                    assert res.status == 200
+            assert server.request_queue_size == price_watch.webapi.server._LISTEN_BACKLOG
+        finally:
+            release.set()
+            stream.join(timeout=5)
+            server.shutdown()
+            server.server_close()
+            thread.join(timeout=5)
+
 
 class TestServerHandle:
     """ServerHandle クラスのテスト"""
@@ -150,7 +505,7 @@ class TestServerStart:
         with (
             patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
             patch("price_watch.webapi.cache.start_file_watcher"),
-            patch("werkzeug.serving.make_server", return_value=mock_server),
+            patch.object(price_watch.webapi.server, "_WebUIServer", return_value=mock_server),
             patch("threading.Thread", return_value=mock_thread) as mock_thread_class,
         ):
             handle = price_watch.webapi.server.start(port=5000, static_dir_path=static_dir)
@@ -173,13 +528,15 @@ class TestServerStart:
         with (
             patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
             patch("price_watch.webapi.cache.start_file_watcher"),
-            patch("werkzeug.serving.make_server", return_value=mock_server) as mock_make_server,
+            patch.object(
+                price_watch.webapi.server, "_WebUIServer", return_value=mock_server
+            ) as mock_server_class,
             patch("threading.Thread", return_value=mock_thread),
         ):
             price_watch.webapi.server.start(port=8080, static_dir_path=static_dir)
 
         # 指定したポートが使われていることを確認
-        call_args = mock_make_server.call_args
+        call_args = mock_server_class.call_args
         assert call_args[0][1] == 8080
 
 
@@ -258,7 +615,7 @@ edit:
             patch("my_lib.logger.init"),
             patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
             patch("price_watch.webapi.cache.start_file_watcher"),
-            patch("werkzeug.serving.make_server", return_value=mock_server),
+            patch.object(price_watch.webapi.server, "_WebUIServer", return_value=mock_server),
             patch("threading.Thread", return_value=mock_thread),
             patch.object(price_watch.webapi.server, "term") as mock_term,
         ):
@@ -300,7 +657,7 @@ edit:
             patch("my_lib.logger.init") as mock_logger_init,
             patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
             patch("price_watch.webapi.cache.start_file_watcher"),
-            patch("werkzeug.serving.make_server", return_value=mock_server),
+            patch.object(price_watch.webapi.server, "_WebUIServer", return_value=mock_server),
             patch("threading.Thread", return_value=mock_thread),
             patch.object(price_watch.webapi.server, "term"),
         ):
@@ -349,7 +706,7 @@ edit:
             patch("logging.warning") as mock_warning,
             patch("price_watch.webapi.cache.get_app_config", return_value=mock_config),
             patch("price_watch.webapi.cache.start_file_watcher"),
-            patch("werkzeug.serving.make_server", return_value=mock_server),
+            patch.object(price_watch.webapi.server, "_WebUIServer", return_value=mock_server),
             patch("threading.Thread", return_value=mock_thread),
             patch.object(price_watch.webapi.server, "term"),
         ):
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/string_pool.py のユニットテスト
+
+文字列プールによるレスポンス圧縮を検証します。
+"""
+
+from __future__ import annotations
+
+import price_watch.webapi.string_pool
+
+
+def _sample_response() -> dict:
+    return {
+        "items": [
+            {
+                "name": "Item1",
+                "best_store": "Store1",
+                "category": "その他",
+                "stores": [
+                    {"store": "Store1", "price_unit": "円", "history": []},
+                    {"store": "Store2", "price_unit": "円", "history": []},
+                ],
+            },
+            {
+                "name": "Item2",
+                "best_store": "Store2",
+                "category": "その他",
+                "stores": [{"store": "Store2", "price_unit": "円", "history": []}],
+            },
+        ],
+        "store_definitions": [{"name": "Store1", "price_unit": "円"}],
+        "categories": ["その他"],
+        "check_interval_sec": 1800,
+    }
+
+
+class TestPack:
+    """pack のテスト"""
+
+    def test_replaces_repeated_strings_with_indices(self) -> None:
+        """対象キーの文字列をインデックスに置き換える"""
+        result = price_watch.webapi.string_pool.pack(_sample_response())
+
+        assert result["strings"] == ["Store1", "その他", "円", "Store2"]
+        assert result["items"][0]["best_store"] == 0
+        assert result["items"][0]["stores"][1] == {"store": 3, "price_unit": 2, "history": []}
+        assert result["items"][1]["category"] == 1
+
+    def test_keeps_other_fields(self) -> None:
+        """対象外のキーはそのまま"""
+        result = price_watch.webapi.string_pool.pack(_sample_response())
+
+        assert result["items"][0]["name"] == "Item1"
+        assert result["store_definitions"][0]["name"] == "Store1"
+        assert result["categories"] == ["その他"]
+        assert result["check_interval_sec"] == 1800
+
+    def test_skips_non_string_values(self) -> None:
+        """文字列以外の値は置き換えない"""
+        result = price_watch.webapi.string_pool.pack({"store": None, "price_unit": 1})
+
+        assert result == {"strings": [], "store": None, "price_unit": 1}
+
+
+class TestUnpack:
+    """unpack のテスト"""
+
+    def test_roundtrip(self) -> None:
+        """pack した結果を元に戻せる"""
+        data = _sample_response()
+
+        assert price_watch.webapi.string_pool.unpack(price_watch.webapi.string_pool.pack(data)) == data
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101
+"""
+webapi/target_editor.py のユニットテスト
+
+target.yaml の書き出し形式とリクエストボディの解析を検証します。
+"""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+import stat
+from unittest.mock import patch
+
+import flask
+import flask.testing
+import pytest
+import yaml
+
+import price_watch.webapi.json_provider
+import price_watch.webapi.schemas
+import price_watch.webapi.target_editor
+
+
+class TestDumpYaml:
+    """_dump_yaml 関数のテスト"""
+
+    def test_keeps_existing_layout(self):
+        """既存の target.yaml と同じインデントで出力する"""
+        data = {
+            "category_list": ["PC パーツ", "その他"],
+            "store_list": [
+                {"name": "yodobashi.com", "color": "#e60012", "assumption": {"point_rate": 10}},
+            ],
+            "item_list": [
+                {"name": "Item", "price": [100, 200], "store": [{"name": "amazon.co.jp", "asin": "B0"}]},
+            ],
+        }
+
+        dumped = price_watch.webapi.target_editor._dump_yaml(data)
+
+        assert dumped == (
+            "category_list:\n"
+            "  - PC パーツ\n"
+            "  - その他\n"
+            "store_list:\n"
+            "  - name: yodobashi.com\n"
+            "    color: '#e60012'\n"
+            "    assumption:\n"
+            "        point_rate: 10\n"
+            "item_list:\n"
+            "  - name: Item\n"
+            "    price:\n"
+            "      - 100\n"
+            "      - 200\n"
+            "    store:\n"
+            "      - name: amazon.co.jp\n"
+            "        asin: B0\n"
+        )
+        assert yaml.safe_load(dumped) == data
+
+    def test_does_not_fold_long_values(self):
+        """長い XPath や URL を折り返さない"""
+        xpath = '//div[contains(@class, "price__current")]/span[contains(@class, "money")]' * 3
+        data = {"store_list": [{"name": "store", "price_xpath": xpath}]}
+
+        dumped = price_watch.webapi.target_editor._dump_yaml(data)
+
+        assert f"    price_xpath: {xpath}\n" in dumped
+
+
+class TestConvertRawToSchema:
+    """_convert_raw_to_schema 関数のテスト"""
+
+    def test_coerces_yaml_scalars_to_str(self):
+        """YAML で数値として読み込まれた値を文字列型のフィールドでは文字列にする"""
+        raw = yaml.safe_load(
+            "category_list:\n"
+            "  - 2024\n"
+            "item_list:\n"
+            "  - name: 1234\n"
+            "    store:\n"
+            "      - name: shopping.yahoo.co.jp\n"
+            "        jan_code: 4901234567890\n"
+            "        search_keyword: 100\n"
+            "        preload:\n"
+            "            url: https://example.com/\n"
+            '            every: "2"\n'
+        )
+
+        config = price_watch.webapi.target_editor._convert_raw_to_schema(raw)
+
+        assert config.category_list == ["2024"]
+        item = config.item_list[0]
+        assert item.name == "1234"
+        assert item.store[0].jan_code == "4901234567890"
+        assert item.store[0].search_keyword == "100"
+        assert item.store[0].preload is not None
+        assert item.store[0].preload.every == 2
+        assert config == price_watch.webapi.schemas.TargetConfigSchema.model_validate(config.model_dump())
+
+
+class TestWriteFileAtomic:
+    """_write_file_atomic 関数のテスト"""
+
+    def test_keeps_existing_mode(self, tmp_path: pathlib.Path):
+        """既存ファイルのパーミッションを引き継ぐ"""
+        target_path = tmp_path / "target.yaml"
+        target_path.write_bytes(b"old")
+        target_path.chmod(0o600)
+
+        price_watch.webapi.target_editor._write_file_atomic(target_path, b"new")
+
+        assert target_path.read_bytes() == b"new"
+        assert stat.S_IMODE(target_path.stat().st_mode) == 0o600
+
+    def test_removes_temp_file_on_failure(self, tmp_path: pathlib.Path):
+        """書き込みに失敗した場合は一時ファイルを削除して元のファイルを残す"""
+        target_path = tmp_path / "target.yaml"
+        target_path.write_bytes(b"old")
+
+        with patch("os.fsync", side_effect=OSError("disk full")), pytest.raises(OSError, match="disk full"):
+            price_watch.webapi.target_editor._write_file_atomic(target_path, b"new")
+
+        assert target_path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [target_path]
+
+
+class TestSaveRawTarget:
+    """_save_raw_target 関数のテスト"""
+
+    def test_prunes_backups_of_non_yaml_name(self, tmp_path: pathlib.Path):
+        """拡張子が .yaml 以外でも作成したバックアップを保持数まで削除する"""
+        target_path = tmp_path / "target.yml"
+        target_path.write_text("category_list: []\n", encoding="utf-8")
+        for i in range(3):
+            (tmp_path / f"target.yml.bak.20240101_00000{i}").write_text("old", encoding="utf-8")
+
+        with (
+            patch.object(price_watch.webapi.target_editor, "_get_target_file_path", return_value=target_path),
+            patch("my_lib.time.now", return_value=datetime.datetime(2024, 1, 2, 0, 0, 0)),
+        ):
+            price_watch.webapi.target_editor._save_raw_target({"category_list": ["PC"]}, backup_count=2)
+
+        backups = sorted(path.name for path in tmp_path.glob("target.yml.bak.*"))
+        assert backups == ["target.yml.bak.20240101_000002", "target.yml.bak.20240102_000000"]
+        assert not (tmp_path / "target.yaml.bak.20240102_000000").exists()
+
+
+class TestParseBody:
+    """_parse_body 関数のテスト"""
+
+    @pytest.fixture
+    def client(self) -> flask.testing.FlaskClient:
+        app = flask.Flask(__name__)
+        app.json = price_watch.webapi.json_provider.ORJSONProvider(app)
+        app.register_blueprint(price_watch.webapi.target_editor.blueprint)
+        return app.test_client()
+
+    @pytest.mark.parametrize("body", [b'{"item_list": [', b""])
+    def test_invalid_json_returns_400(self, client: flask.testing.FlaskClient, body: bytes):
+        """JSON として不正なボディ・空のボディには 400 を返す"""
+        response = client.post("/api/target/validate", data=body, content_type="application/json")
+
+        assert response.status_code == 400
+        errors = response.get_json()["validation_error"]["body_params"]
+        assert errors[0]["type"] == "json_invalid"
+        assert "input" not in errors[0]